@@ -4,8 +4,10 @@ from xodex.contrib.objects.animator import Animator
 from xodex.contrib.objects.animator import Anime
 from xodex.contrib.objects.animator import MultiAnimator
 from xodex.contrib.objects.animator import SpriteSheetAnimator
+from xodex.contrib.objects.image import draw_images
 from xodex.contrib.objects.image import Image
 from xodex.contrib.objects.image import MovingImage
+from xodex.contrib.objects.image import ScrollingImage
 from xodex.contrib.objects.image import Sprite
 from xodex.contrib.objects.spritesheet import SheetAnimator
 from xodex.contrib.objects.spritesheet import SpriteSheet
@@ -14,13 +16,14 @@ from xodex.contrib.objects.text import XodexText
 __all__ = (
     "XodexText",
     "MovingImage",
+    "ScrollingImage",
     "Sprite",
     "Animator",
     "Anime",
     "SpriteSheetAnimator",
     "Image",
     "MultiAnimator",
-    "Image",
     "SpriteSheet",
     "SheetAnimator",
+    "draw_images",
 )
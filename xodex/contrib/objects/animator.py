@@ -6,6 +6,7 @@ Supports looping, ping-pong, reverse, and callbacks on finish.
 
 from __future__ import annotations
 
+import weakref
 from collections.abc import Callable
 
 import pygame
@@ -15,6 +16,101 @@ from xodex.contrib.objects.image import Image
 from xodex.object.base import DrawableObject
 from xodex.object.base import EventfulObject
 from xodex.object.base import LogicalObject
+from xodex.utils.functions import loadimage
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _convert_surface(frame: Surface) -> Image:
+    """
+    Wrap a raw Surface as an Image, converting to the display pixel format.
+
+    Unconverted surfaces force SDL to convert pixel formats on every blit;
+    converting once here moves that cost to construction time. Requires an
+    active display, so the conversion is skipped when none is set yet.
+    """
+    if pygame.display.get_surface() is not None:
+        frame = frame.convert_alpha() if frame.get_flags() & pygame.SRCALPHA else frame.convert()
+    return Image(frame)
+
+
+# Decoded surfaces for path frames, keyed by file path, so scenes that build
+# many animators from the same files decode each file only once.
+_STR_FRAME_CACHE: dict[str, Surface] = {}
+
+
+def _load_str(path: str) -> Image:
+    """Load a path frame through the module-level surface cache."""
+    surface = _STR_FRAME_CACHE.get(path)
+    if surface is None:
+        surface = loadimage(path)
+        _STR_FRAME_CACHE[path] = surface
+    return Image(surface)
+
+
+# Exact-type dispatch for frame conversion: one hash probe instead of an
+# isinstance ladder per frame. Subclasses fall back to the isinstance path.
+_CONVERT = {Surface: _convert_surface, Image: lambda frame: frame, str: _load_str}
+
+
+def _advance(time_accum, frame_duration, current, n, direction, loop, pingpong):
+    """
+    Pure-scalar frame advance shared by `Animator._advance_frames`.
+
+    Computes how many whole frames the accumulated time covers with a single
+    integer division and applies loop/pingpong/finish logic in closed form
+    (pingpong uses the period-2(n-1) reflection formula).
+
+    Returns:
+        tuple: (time_accum, current, direction, finished)
+    """
+    steps = int(time_accum // frame_duration)
+    time_accum -= steps * frame_duration
+    finished = False
+    if n == 1:
+        return time_accum, 0, direction, finished
+    if pingpong:
+        # Branchless reflection: advance a phase over a cycle of period
+        # 2*(n-1) and mirror the backward half; the direction flag is
+        # implied by which half the phase lands in.
+        period = 2 * (n - 1)
+        phase = current if direction == 1 else (period - current) % period
+        phase = (phase + steps) % period
+        current = phase if phase < n else period - phase
+        direction = 1 if phase < n - 1 else -1
+    elif loop:
+        current = (current + steps * direction) % n
+    else:
+        raw = current + steps * direction
+        if raw >= n or raw < 0:
+            finished = True
+            current = max(0, min(raw, n - 1))
+        else:
+            current = raw
+    return time_accum, current, direction, finished
+
+
+if HAS_NUMBA:
+    _advance = njit(cache=True)(_advance)
+
+
+def _to_image(frame: Image | Surface | str) -> Image:
+    """Convert a single frame to an Image."""
+    try:
+        return _CONVERT[type(frame)](frame)
+    except KeyError:
+        if isinstance(frame, Image):
+            return frame
+        if isinstance(frame, Surface):
+            return _convert_surface(frame)
+        if isinstance(frame, str):
+            return _load_str(frame)
+        raise TypeError("Animator frames must be Image, Surface, or str.") from None
 
 
 class Animator(DrawableObject, EventfulObject, LogicalObject):
@@ -54,6 +150,32 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
         _speed_scale (float): Speed scaling factor.
     """
 
+    __slots__ = (
+        "__dict__",  # keeps per-instance flag toggles working now that the bases are slotted
+        "_frames",
+        "_frame_duration",
+        "_current_frame",
+        "_time_accum",
+        "_loop",
+        "_pingpong",
+        "_reverse",
+        "_on_finish",
+        "_on_frame",
+        "_on_loop",
+        "_on_pingpong",
+        "_finished",
+        "_paused",
+        "_direction",
+        "_speed_scale",
+        "_img_rect",
+    )
+
+    _registry: weakref.WeakSet = weakref.WeakSet()
+
+    # Reusable SoA scratch buffers for update_batch (grown on demand).
+    _batch_capacity: int = 0
+    _batch_scratch: tuple = None
+
     def __init__(
         self,
         frames: list[Image | Surface | str],
@@ -67,16 +189,7 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
         on_pingpong: Callable | None = None,
         **kwargs,
     ):
-        self._frames: list[Image] = []
-        for frame in frames:
-            if isinstance(frame, Surface):
-                self._frames.append(Image(frame))
-            elif isinstance(frame, Image):
-                self._frames.append(frame)
-            elif isinstance(frame, str):
-                self._frames.append(Image(frame))
-            else:
-                raise TypeError("Animator frames must be Image, Surface, or str.")
+        self._frames: list[Image] = [_to_image(frame) for frame in frames]
 
         self._frame_duration = frame_duration
         self._current_frame = 0
@@ -93,12 +206,15 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
         self._direction = -1 if reverse else 1
         self._speed_scale = 1.0
         self._img_rect = self._frames[self._current_frame].rect
+        self._alias_frame_rects()
 
         position = kwargs.pop("pos", None)
         if position:
             self._img_rect.x = position[0]
             self._img_rect.y = position[1]
 
+        Animator._registry.add(self)
+
     @classmethod
     async def async_from_paths(cls, paths: list[str], **kwargs) -> Animator:
         """
@@ -133,15 +249,30 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
     def __repr__(self):
         return f"<{self.__class__.__name__}({len(self)} frames)>"
 
+    def _alias_frame_rects(self) -> None:
+        """
+        Make every frame share the animator's rect object.
+
+        All frames alias `_img_rect` by reference, so moving the animator
+        moves every frame and `perform_draw` never has to copy the rect onto
+        the current frame. Re-run after replacing `_img_rect` or `_frames`.
+        """
+        for frame in self._frames:
+            frame._img_rect = self._img_rect
+            # The frame's draw closure captured its construction-time rect;
+            # rebind so it draws from the shared one.
+            frame._rebind_draw()
+
     @property
     def rect(self) -> pygame.Rect:
         """Get the (x, y) position of the image."""
         return self._img_rect
 
     @rect.setter
-    def rect(self, x: int, y: int, width: int, height: int):
-        """Set the (x, y) position of the image."""
-        self._img_rect = pygame.Rect(x, y, width, height)
+    def rect(self, new_rect: pygame.Rect):
+        """Set the rect of the animator (re-aliased into every frame)."""
+        self._img_rect = new_rect
+        self._alias_frame_rects()
 
     @property
     def position(self) -> tuple[int, int]:
@@ -223,15 +354,11 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
 
     def set_frames(self, frames: list[Image | Surface]):
         """Set the animation frames and reset."""
-        _frames = []
-        for frame in frames:
-            if isinstance(frame, Surface):
-                _frames.append(Image(frame))
-            elif isinstance(frame, Image):
-                _frames.append(frame)
-            else:
-                pass
-        self._frames = _frames
+        if all(type(frame) is Image for frame in frames):
+            self._frames = list(frames)
+        else:
+            self._frames = [_to_image(frame) for frame in frames]
+        self._alias_frame_rects()
         self.reset()
 
     def set_speed(self, fps: int):
@@ -285,9 +412,7 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
         Args:
             surface (Surface): The target surface.
         """
-        image = self.get_image()
-        image.rect = self.rect
-        image.perform_draw(surface)
+        self._frames[self._current_frame].perform_draw(surface)
 
     def perform_update(self, deltatime: float, *args, **kwargs) -> None:
         """
@@ -299,36 +424,143 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
         if self._finished or self._paused or len(self._frames) == 0:
             return
         self._time_accum += deltatime * self._speed_scale
+        if self._time_accum < self._frame_duration:
+            return
+        if self._on_frame is None and self._on_loop is None and self._on_pingpong is None:
+            self._advance_frames()
+            return
+        # Per-cycle callbacks require stepping one frame at a time.
+        # Bind hot attributes to locals; write the mutated ones back once.
+        frame_count = len(self._frames)
+        frame_duration = self._frame_duration
+        time_accum = self._time_accum
+        current = self._current_frame
+        direction = self._direction
         frame_changed = False
-        while self._time_accum >= self._frame_duration:
-            self._time_accum -= self._frame_duration
-            # prev_frame = self._current_frame
-            self._current_frame += self._direction
+        finished = False
+        while time_accum >= frame_duration:
+            time_accum -= frame_duration
+            current += direction
             frame_changed = True
             if self._pingpong:
-                if self._current_frame >= len(self._frames):
-                    self._current_frame = len(self._frames) - 2
-                    self._direction = -1
+                if current >= frame_count:
+                    current = frame_count - 2
+                    direction = -1
                     if self._on_pingpong:
                         self._on_pingpong()
-                elif self._current_frame < 0:
-                    self._current_frame = 1
-                    self._direction = 1
+                elif current < 0:
+                    current = 1
+                    direction = 1
                     if self._on_pingpong:
                         self._on_pingpong()
             else:
-                if self._current_frame >= len(self._frames) or self._current_frame < 0:
+                if current >= frame_count or current < 0:
                     if self._loop:
                         if self._on_loop:
                             self._on_loop()
-                        self._current_frame = 0 if self._direction == 1 else len(self._frames) - 1
+                        current = 0 if direction == 1 else frame_count - 1
                     else:
-                        self._finished = True
-                        if self._on_finish:
-                            self._on_finish()
-                        self._current_frame = max(0, min(self._current_frame, len(self._frames) - 1))
+                        finished = True
+                        current = max(0, min(current, frame_count - 1))
+                        break
             if frame_changed and self._on_frame:
-                self._on_frame(self._current_frame)
+                self._on_frame(current)
+        self._time_accum = time_accum
+        self._current_frame = current
+        self._direction = direction
+        if finished:
+            self._finished = True
+            if self._on_frame:
+                self._on_frame(current)
+            if self._on_finish:
+                self._on_finish()
+
+    def _advance_frames(self) -> None:
+        """
+        Advance the current frame in closed form (O(1) in elapsed frames).
+
+        Delegates the arithmetic to the module-level `_advance` kernel, which
+        is JIT-compiled when numba is installed.
+        """
+        self._time_accum, self._current_frame, self._direction, finished = _advance(
+            self._time_accum,
+            self._frame_duration,
+            self._current_frame,
+            len(self._frames),
+            self._direction,
+            self._loop,
+            self._pingpong,
+        )
+        if finished:
+            self._finished = True
+            if self._on_finish:
+                self._on_finish()
+
+    @classmethod
+    def update_batch(cls, animators: list[Animator], deltatime: float) -> None:
+        """
+        Update many animators at once, vectorizing the common case.
+
+        Looping animators without per-cycle callbacks are packed into parallel
+        NumPy arrays (SoA layout) and advanced with a single set of array
+        operations; the rest fall back to their regular `perform_update`.
+
+        Args:
+            animators (list[Animator]): Animators to update.
+            deltatime (float): Time since last update in ms.
+        """
+        import numpy as np
+
+        fast: list[Animator] = []
+        for animator in animators:
+            if animator._finished or animator._paused or not animator._frames:
+                continue
+            if (
+                animator._loop
+                and not animator._pingpong
+                and animator._on_frame is None
+                and animator._on_loop is None
+                and animator._on_pingpong is None
+            ):
+                fast.append(animator)
+            else:
+                animator.perform_update(deltatime)
+        if not fast:
+            return
+        count = len(fast)
+        if cls._batch_capacity < count:
+            cls._batch_scratch = (
+                np.empty(count, dtype=np.float64),
+                np.empty(count, dtype=np.float64),
+                np.empty(count, dtype=np.int64),
+                np.empty(count, dtype=np.int64),
+                np.empty(count, dtype=np.int64),
+            )
+            cls._batch_capacity = count
+        time_accum, duration, current, direction, nframes = (arr[:count] for arr in cls._batch_scratch)
+        for i, animator in enumerate(fast):
+            time_accum[i] = animator._time_accum + deltatime * animator._speed_scale
+            duration[i] = animator._frame_duration
+            current[i] = animator._current_frame
+            direction[i] = animator._direction
+            nframes[i] = len(animator._frames)
+        steps = np.floor_divide(time_accum, duration).astype(np.int64)
+        time_accum -= steps * duration
+        current += steps * direction
+        np.mod(current, nframes, out=current)
+        for animator, accum, frame in zip(fast, time_accum, current):
+            animator._time_accum = float(accum)
+            animator._current_frame = int(frame)
+
+    @classmethod
+    def update_all(cls, deltatime: float) -> None:
+        """Batch-update every live Animator (see `update_batch`)."""
+        cls.update_batch(list(cls._registry), deltatime)
+
+    @classmethod
+    def clear_image_cache(cls) -> None:
+        """Release the cached surfaces for path frames (e.g. between levels)."""
+        _STR_FRAME_CACHE.clear()
 
     def handle_event(self, event: pygame.event.Event, *args, **kwargs) -> None:
         """Handle pygame events (stub for extension)."""
@@ -354,9 +586,12 @@ class Animator(DrawableObject, EventfulObject, LogicalObject):
 class Anime(DrawableObject, LogicalObject, EventfulObject):  # dino
     """Anime"""
 
+    __slots__ = ("__dict__", "_animations", "_current", "_current_animator")
+
     def __init__(self, animation: dict[str, Animator] = None, default: str = None):
         self._animations: dict[str, Animator] = {}
         self._current: str = None
+        self._current_animator: Animator = None
 
         if animation:
             if isinstance(animation, dict):
@@ -365,6 +600,7 @@ class Anime(DrawableObject, LogicalObject, EventfulObject):  # dino
                 raise TypeError
         if default:
             self._current = default
+            self._current_animator = self._animations.get(default)
 
     def __str__(self):
         """Return a string representation of the Animator."""
@@ -376,17 +612,17 @@ class Anime(DrawableObject, LogicalObject, EventfulObject):  # dino
 
     @property
     def current(self) -> Animator:
-        """Current Animator."""
-        try:
-            return self._animations[self._current]
-        except KeyError:
+        """Current Animator (resolved once and cached until changed)."""
+        if self._current_animator is None:
             print("Current Animator is null")
+        return self._current_animator
 
     @current.setter
     def current(self, anime) -> str:
         """Current Animator."""
         if anime in self._animations:
             self._current = anime
+            self._current_animator = self._animations[anime]
 
     @property
     def animators(self):
@@ -396,20 +632,20 @@ class Anime(DrawableObject, LogicalObject, EventfulObject):  # dino
     @property  # flappy
     def rect(self) -> pygame.Rect:
         """Get or Set the rect of the anime."""
-        return self.current.rect
+        return self._current_animator.rect
 
     @rect.setter  # flappy
     def rect(self, new_rect: pygame.Rect):
-        self.current.rect = new_rect
+        self._current_animator.rect = new_rect
 
     @property
     def position(self) -> tuple[int, int]:
         """Get the (x, y) position of the anime."""
-        return self.current.position
+        return self._current_animator.position
 
     @position.setter
     def position(self, pos: tuple[int, int]):
-        self.current.position = pos
+        self._current_animator.position = pos
 
     def play(self, anime: str = None):
         """play"""
@@ -419,9 +655,13 @@ class Anime(DrawableObject, LogicalObject, EventfulObject):  # dino
     def add(self, name: str, animator: Animator) -> None:
         """add"""
         self._animations[name] = animator
+        if name == self._current:
+            self._current_animator = animator
 
     def pop(self, name: str) -> None:
         """pop"""
+        if name == self._current:
+            self._current_animator = None
         return self._animations.pop(name, None)
 
     def remove(self, name: str) -> None:
@@ -435,7 +675,7 @@ class Anime(DrawableObject, LogicalObject, EventfulObject):  # dino
         Args:
             surface (Surface): The target surface.
         """
-        self.current.perform_draw(surface, *args, **kwargs)
+        self._current_animator.perform_draw(surface, *args, **kwargs)
 
     def perform_update(self, deltatime: float, *args, **kwargs) -> None:
         """
@@ -444,11 +684,11 @@ class Anime(DrawableObject, LogicalObject, EventfulObject):  # dino
         Args:
             deltatime (float): Time since last update in ms.
         """
-        self.current.perform_update(deltatime, *args, **kwargs)
+        self._current_animator.perform_update(deltatime, *args, **kwargs)
 
     def handle_event(self, event: pygame.event.Event, *args, **kwargs) -> None:
         """Handle pygame events (stub for extension)."""
-        self.current.handle_event(event, *args, **kwargs)
+        self._current_animator.handle_event(event, *args, **kwargs)
 
 
 class SpriteSheetAnimator(Animator):
@@ -468,6 +708,8 @@ class SpriteSheetAnimator(Animator):
         anim = SpriteSheetAnimator(sheet, 32, 32, rows=4, cols=4, frame_duration=80)
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         sheet: Image,
@@ -495,6 +737,8 @@ class MultiAnimator(Animator):
         multi.set_animation("jump")
     """
 
+    __slots__ = ("_animations", "_current")
+
     def __init__(self, animations: dict[str, Animator], default: str = None):
         self._animations = animations
         self._current = default or next(iter(animations))
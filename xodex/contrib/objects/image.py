@@ -7,6 +7,8 @@ and rotation. Integrates with the DrawableObject interface for rendering.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import PIL.Image
 import PIL.ImageFilter
 import PIL.ImageOps
@@ -15,8 +17,47 @@ from pygame import Color
 from pygame import Surface
 
 from xodex.object.base import DrawableObject
+from xodex.utils._fast_pixops import HAS_NUMBA
+from xodex.utils._fast_pixops import make_swap_kernel
 from xodex.utils.functions import loadimage
 
+try:
+    from scipy.ndimage import gaussian_filter1d
+
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+
+@lru_cache(maxsize=256)
+def _load_cached(path: str) -> Surface:
+    """Decode an image file once per path; callers must copy before mutating."""
+    return loadimage(path)
+
+
+def draw_images(surface: Surface, images) -> None:
+    """
+    Draw many Images with a single Surface.blits call.
+
+    Packs every image's (surface, rect) pair and hands the list to
+    pygame's C-level blit loop, turning N Python blit calls into one.
+    MovingImages are stepped first so their bounce logic still runs.
+    All images land in list order, so callers keep z-ordering by passing
+    an ordered iterable.
+
+    Args:
+        surface (Surface): The target surface.
+        images: Iterable of Image (or subclass) instances.
+    """
+    pairs = []
+    append = pairs.append
+    for img in images:
+        step = getattr(img, "_step", None)
+        if step is not None:
+            step()
+        append((img._image, img._img_rect))
+    surface.blits(pairs, doreturn=False)
+
 
 class Image(DrawableObject):
     """
@@ -31,12 +72,18 @@ class Image(DrawableObject):
         _img_rect (pygame.Rect): The rectangle representing the image's position and size.
     """
 
+    # Instances also store a perform_draw closure (see _rebind_draw), which
+    # lands in the __dict__ still provided by the DrawableObject bases; the
+    # slots below give the hot attributes direct C-struct access.
+    __slots__ = ("__dict__", "_image", "_img_rect", "_transform_cache")
+
     def __init__(
         self,
         image: str | Surface = None,
         pos: tuple[int, int] = (0, 0),
         alpha: int = None,
         colorkey: Color = None,
+        shared: bool = False,
     ) -> None:
         """
         Initialize the Image.
@@ -46,11 +93,24 @@ class Image(DrawableObject):
             pos: Initial (x, y) position.
             alpha: Optional alpha value (0-255).
             colorkey: Optional color key for transparency.
+            shared: Reuse the cached decoded Surface without copying. Only
+                safe for Images that are never mutated in place (no blur,
+                swap_color, set_alpha or colorkey).
         """
         if isinstance(image, str):
-            self._image = loadimage(image)
+            # Decode once per path and hand out copies; re-decoding PNG/JPEG
+            # bytes for every Image of the same asset costs milliseconds
+            # where a surface copy costs microseconds. loadimage already
+            # display-converts.
+            src = _load_cached(image)
+            self._image = src if shared else src.copy()
         elif isinstance(image, Surface):
-            self._image = image.copy()
+            # Convert to the display pixel format up front so every later
+            # blit takes pygame's fast same-format path (convert copies).
+            try:
+                self._image = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+            except pygame.error:  # no display mode set yet
+                self._image = image.copy()
         else:
             raise ValueError("Image must be initialized with a file path or pygame.Surface.")
 
@@ -61,6 +121,8 @@ class Image(DrawableObject):
 
         self._img_rect = self._image.get_rect()
         self._img_rect.x, self._img_rect.y = pos
+        self._transform_cache: dict = {}
+        self._rebind_draw()
 
     def __repr__(self):
         return f"<{self.__class__.__name__}({self._image})>"
@@ -84,6 +146,7 @@ class Image(DrawableObject):
     @rect.setter
     def rect(self, new_rect: pygame.Rect) -> None:
         self._img_rect = new_rect
+        self._rebind_draw()
 
     @property
     def position(self) -> tuple[int, int]:
@@ -98,6 +161,50 @@ class Image(DrawableObject):
         """Set the (x, y) position."""
         self._img_rect.x, self._img_rect.y = pos
 
+    def _cached_transform(self, op: str, args: tuple, func) -> Surface:
+        """
+        Return a cached pygame.transform result for the current surface.
+
+        Keyed by (surface id, op, args) so repeating the same transform every
+        frame (HUD/background redraws) costs a dict lookup instead of a full
+        pixel walk. Mutators that replace or repaint the surface outside this
+        helper must clear the cache, since a freed surface's id can be
+        recycled and serve a stale entry.
+        """
+        key = (id(self._image), op, args)
+        cache = self._transform_cache
+        result = cache.get(key)
+        if result is None:
+            result = func(self._image)
+            if len(cache) > 32:
+                cache.clear()
+            cache[key] = result
+        return result
+
+    def _rebind_draw(self) -> None:
+        """
+        Install a perform_draw specialized for the current surface and rect.
+
+        Plain Images draw through a closure holding both as locals — one
+        LOAD_FAST each per frame instead of a property call plus attribute
+        lookups. Subclasses keep their own perform_draw overrides, so only
+        exact Image instances get the binding; mutators that replace the
+        surface or rect call this again.
+        """
+        if type(self) is not Image:
+            return
+        img = self._image
+        rect = self._img_rect
+
+        def perform_draw(surface: Surface, *args, **kwargs) -> None:
+            surface.blit(img, rect)
+
+        self.perform_draw = perform_draw
+
+    def _sync_rect(self) -> None:
+        """Resize the rect in place to match the current surface (keeps topleft, allocates no Rect)."""
+        self._img_rect.size = self._image.get_size()
+
     def size(self) -> tuple[int, int]:
         """Return the (width, height) of the image."""
         return self._img_rect.size
@@ -134,10 +241,10 @@ class Image(DrawableObject):
         Returns:
             Image: Self for chaining.
         """
-        self._image = pygame.transform.scale(self._image, (int(x), int(y)))
-        topleft = self._img_rect.topleft
-        self._img_rect = self._image.get_rect()
-        self._img_rect.topleft = topleft
+        size = (int(x), int(y))
+        self._image = self._cached_transform("scale", size, lambda img: pygame.transform.scale(img, size))
+        self._sync_rect()
+        self._rebind_draw()
         return self
 
     def smoothscale(self, x: float, y: float) -> Image:
@@ -151,10 +258,10 @@ class Image(DrawableObject):
         Returns:
             Image: Self for chaining.
         """
-        self._image = pygame.transform.smoothscale(self._image, (int(x), int(y)))
-        topleft = self._img_rect.topleft
-        self._img_rect = self._image.get_rect()
-        self._img_rect.topleft = topleft
+        size = (int(x), int(y))
+        self._image = self._cached_transform("smoothscale", size, lambda img: pygame.transform.smoothscale(img, size))
+        self._sync_rect()
+        self._rebind_draw()
         return self
 
     def flip(self, flip_x: bool, flip_y: bool) -> Image:
@@ -168,10 +275,11 @@ class Image(DrawableObject):
         Returns:
             Image: Self for chaining.
         """
-        self._image = pygame.transform.flip(self._image, flip_x, flip_y)
-        topleft = self._img_rect.topleft
-        self._img_rect = self._image.get_rect()
-        self._img_rect.topleft = topleft
+        self._image = self._cached_transform(
+            "flip", (flip_x, flip_y), lambda img: pygame.transform.flip(img, flip_x, flip_y)
+        )
+        self._sync_rect()
+        self._rebind_draw()
         return self
 
     def blur(self, blur_count: float = 5) -> Image:
@@ -184,9 +292,40 @@ class Image(DrawableObject):
         Returns:
             Image: Self for chaining.
         """
-        impil = PIL.Image.frombytes("RGBA", self._img_rect.size, pygame.image.tobytes(self._image, "RGBA"))
-        impil = impil.filter(PIL.ImageFilter.GaussianBlur(radius=blur_count))
-        self._image = pygame.image.frombytes(impil.tobytes(), impil.size, "RGBA").convert()
+        if HAS_SCIPY:
+            # Separable 1D Gaussian on a pixel array: two O(N) passes instead
+            # of the PIL bytes roundtrip, with no Surface<->bytes conversions.
+            arr = pygame.surfarray.array3d(self._image)
+            arr = gaussian_filter1d(arr, blur_count, axis=0)
+            arr = gaussian_filter1d(arr, blur_count, axis=1)
+            self._image = pygame.surfarray.make_surface(arr).convert()
+            self._transform_cache.clear()
+            self._rebind_draw()
+            return self
+        import numpy as np  # lazy: only the PIL path needs it
+
+        try:
+            rgb = pygame.surfarray.pixels3d(self._image)
+            alpha = pygame.surfarray.pixels_alpha(self._image)
+        except (pygame.error, ValueError):
+            # No per-pixel alpha (or the surface can't expose views); take
+            # the bytes roundtrip.
+            impil = PIL.Image.frombytes("RGBA", self._img_rect.size, pygame.image.tobytes(self._image, "RGBA"))
+            impil = impil.filter(PIL.ImageFilter.GaussianBlur(radius=blur_count))
+            self._image = pygame.image.frombytes(impil.tobytes(), impil.size, "RGBA").convert()
+            self._transform_cache.clear()
+            self._rebind_draw()
+            return self
+        # Filter through PIL but write the result straight back through the
+        # pixel views — no tobytes/frombytes buffers and no replacement
+        # surface, so the existing surface (and draw closure) stay valid.
+        rgba = np.dstack((rgb, alpha)).swapaxes(0, 1)
+        impil = PIL.Image.fromarray(rgba, "RGBA").filter(PIL.ImageFilter.GaussianBlur(radius=blur_count))
+        out = np.asarray(impil).swapaxes(0, 1)
+        rgb[:] = out[..., :3]
+        alpha[:] = out[..., 3]
+        del rgb, alpha
+        self._transform_cache.clear()
         return self
 
     def crop(self, rect: pygame.Rect) -> Image:
@@ -227,14 +366,46 @@ class Image(DrawableObject):
         Returns:
             Image: Self for chaining.
         """
-        arr = pygame.surfarray.pixels3d(self._image)
+        # Paletted (8-bit) surfaces: swap in the palette instead of touching
+        # pixels — O(256) instead of O(width * height). Only applies when the
+        # image was loaded without .convert() stripping the palette.
+        try:
+            palette = self._image.get_palette()
+        except pygame.error:
+            palette = None
+        if palette is not None:
+            r1, g1, b1 = from_color.r, from_color.g, from_color.b
+            for i, color in enumerate(palette):
+                if color.r == r1 and color.g == g1 and color.b == b1:
+                    self._image.set_palette_at(i, to_color)
+            self._transform_cache.clear()
+            return self
+
+        try:
+            arr = pygame.surfarray.pixels3d(self._image)
+            copied = False
+        except pygame.error:
+            # Surface can't expose a direct view (e.g. locked); fall back to
+            # a copy and blit the result back.
+            arr = pygame.surfarray.array3d(self._image)
+            copied = True
         r1, g1, b1 = from_color.r, from_color.g, from_color.b
         r2, g2, b2 = to_color.r, to_color.g, to_color.b
-        mask = (arr[:, :, 0] == r1) & (arr[:, :, 1] == g1) & (arr[:, :, 2] == b1)
-        arr[:, :, 0][mask] = r2
-        arr[:, :, 1][mask] = g2
-        arr[:, :, 2][mask] = b2
-        del arr
+        if HAS_NUMBA and arr.size > 65536:
+            # One fused compare-and-store pass with the colors baked in as
+            # literals; the threshold amortizes the numba dispatch overhead
+            # over enough pixels to win.
+            make_swap_kernel(r1, g1, b1, r2, g2, b2)(arr)
+        else:
+            mask = (arr[:, :, 0] == r1) & (arr[:, :, 1] == g1) & (arr[:, :, 2] == b1)
+            arr[:, :, 0][mask] = r2
+            arr[:, :, 1][mask] = g2
+            arr[:, :, 2][mask] = b2
+        if copied:
+            pygame.surfarray.blit_array(self._image, arr)
+        else:
+            del arr  # release the surface lock
+        self._transform_cache.clear()
         return self
 
     def tint(self, color: Color, alpha: int = 128) -> Image:
@@ -251,6 +422,7 @@ class Image(DrawableObject):
         tint_surface = pygame.Surface(self._image.get_size(), pygame.SRCALPHA)
         tint_surface.fill((*color, alpha))
         self._image.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        self._transform_cache.clear()
         return self
 
     def rotate(self, angle: float) -> Image:
@@ -263,10 +435,9 @@ class Image(DrawableObject):
         Returns:
             Image: Self for chaining.
         """
-        self._image = pygame.transform.rotate(self._image, angle)
-        topleft = self._img_rect.topleft
-        self._img_rect = self._image.get_rect()
-        self._img_rect.topleft = topleft
+        self._image = self._cached_transform("rotate", (angle,), lambda img: pygame.transform.rotate(img, angle))
+        self._sync_rect()
+        self._rebind_draw()
         return self
 
     def set_alpha(self, alpha: int) -> Image:
@@ -338,6 +509,8 @@ class Image(DrawableObject):
         pil_img = PIL.Image.frombytes("RGBA", self._img_rect.size, pygame.image.tobytes(self._image, "RGBA"))
         pil_img = PIL.ImageOps.grayscale(pil_img).convert("RGBA")
         self._image = pygame.image.frombytes(pil_img.tobytes(), pil_img.size, "RGBA").convert()
+        self._transform_cache.clear()
+        self._rebind_draw()
         return self
 
     def filter_invert(self) -> Image:
@@ -350,6 +523,8 @@ class Image(DrawableObject):
         pil_img = PIL.Image.frombytes("RGBA", self._img_rect.size, pygame.image.tobytes(self._image, "RGBA"))
         pil_img = PIL.ImageOps.invert(pil_img.convert("RGB")).convert("RGBA")
         self._image = pygame.image.frombytes(pil_img.tobytes(), pil_img.size, "RGBA").convert()
+        self._transform_cache.clear()
+        self._rebind_draw()
         return self
 
     def filter_sharpen(self) -> Image:
@@ -362,6 +537,8 @@ class Image(DrawableObject):
         pil_img = PIL.Image.frombytes("RGBA", self._img_rect.size, pygame.image.tobytes(self._image, "RGBA"))
         pil_img = pil_img.filter(PIL.ImageFilter.SHARPEN)
         self._image = pygame.image.frombytes(pil_img.tobytes(), pil_img.size, "RGBA").convert()
+        self._transform_cache.clear()
+        self._rebind_draw()
         return self
 
     def filter_edge_enhance(self) -> Image:
@@ -374,6 +551,8 @@ class Image(DrawableObject):
         pil_img = PIL.Image.frombytes("RGBA", self._img_rect.size, pygame.image.tobytes(self._image, "RGBA"))
         pil_img = pil_img.filter(PIL.ImageFilter.EDGE_ENHANCE)
         self._image = pygame.image.frombytes(pil_img.tobytes(), pil_img.size, "RGBA").convert()
+        self._transform_cache.clear()
+        self._rebind_draw()
         return self
 
     def perform_draw(self, surface: Surface, *args, **kwargs) -> None:
@@ -383,7 +562,7 @@ class Image(DrawableObject):
         Args:
             surface (Surface): The target surface.
         """
-        surface.blit(self.image, self._img_rect)
+        surface.blit(self._image, self._img_rect)
 
 
 class MovingImage(Image):
@@ -403,6 +582,8 @@ class MovingImage(Image):
     - Speed and direction control.
     """
 
+    __slots__ = ("move_x", "move_y", "vel_x", "vel_y", "win_width", "win_height", "_step")
+
     def __init__(
         self,
         image: str | Surface,
@@ -418,19 +599,38 @@ class MovingImage(Image):
         self.vel_y = speed
         self.win_width = win_width
         self.win_height = win_height
+        self._rebind_step()
+
+    def _rebind_step(self) -> None:
+        """Pick a mover specialized for the enabled axes, so perform_draw skips the per-frame axis checks."""
+        self._step = {
+            (True, True): self._step_xy,
+            (True, False): self._step_x,
+            (False, True): self._step_y,
+        }.get((self.move_x, self.move_y))
+
+    def _step_x(self) -> None:
+        rect = self._img_rect
+        rect.x += self.vel_x
+        if rect.left < 0 or rect.right > self.win_width:
+            self.vel_x = -self.vel_x
+            rect.x += self.vel_x
+
+    def _step_y(self) -> None:
+        rect = self._img_rect
+        rect.y += self.vel_y
+        if rect.top < 0 or rect.bottom > self.win_height:
+            self.vel_y = -self.vel_y
+            rect.y += self.vel_y
+
+    def _step_xy(self) -> None:
+        self._step_x()
+        self._step_y()
 
     def perform_draw(self, surface, *args, **kwargs):
         # Move and bounce off edges
-        if self.move_x:
-            self._img_rect.x += self.vel_x
-            if self._img_rect.left < 0 or self._img_rect.right > self.win_width:
-                self.vel_x = -self.vel_x
-                self._img_rect.x += self.vel_x
-        if self.move_y:
-            self._img_rect.y += self.vel_y
-            if self._img_rect.top < 0 or self._img_rect.bottom > self.win_height:
-                self.vel_y = -self.vel_y
-                self._img_rect.y += self.vel_y
+        if self._step is not None:
+            self._step()
         return super().perform_draw(surface, *args, **kwargs)
 
     @property
@@ -445,6 +645,7 @@ class MovingImage(Image):
     @allow_x.setter
     def allow_x(self, allow: bool):
         self.move_x = allow
+        self._rebind_step()
 
     @property
     def speed_x(self):
@@ -463,6 +664,7 @@ class MovingImage(Image):
     @allow_y.setter
     def allow_y(self, allow: bool):
         self.move_y = allow
+        self._rebind_step()
 
     @property
     def speed_y(self):
@@ -474,6 +676,57 @@ class MovingImage(Image):
         self.vel_y = speed
 
 
+class ScrollingImage(Image):
+    """
+    Image that scrolls endlessly inside a viewport.
+
+    The source image is tiled once onto a backing surface at construction;
+    each frame only advances an integer offset and blits a fixed-size slice,
+    so scrolling costs two modulos and a single same-format blit instead of
+    per-frame wrap arithmetic and multiple blits.
+
+    Args:
+        image: Path or Surface to tile.
+        win_width: Viewport width.
+        win_height: Viewport height.
+        speed_x: Horizontal scroll speed in pixels per frame.
+        speed_y: Vertical scroll speed in pixels per frame.
+    """
+
+    __slots__ = ("win_width", "win_height", "vel_x", "vel_y", "_ox", "_oy", "_tiled")
+
+    def __init__(
+        self,
+        image: str | Surface,
+        win_width: int,
+        win_height: int,
+        speed_x: int = 1,
+        speed_y: int = 0,
+    ):
+        super().__init__(image, (0, 0))
+        self.win_width = win_width
+        self.win_height = win_height
+        self.vel_x = speed_x
+        self.vel_y = speed_y
+        self._ox = 0
+        self._oy = 0
+        tile_w, tile_h = self._image.get_size()
+        backing = pygame.Surface((win_width + tile_w, win_height + tile_h))
+        for y in range(0, win_height + tile_h, tile_h):
+            for x in range(0, win_width + tile_w, tile_w):
+                backing.blit(self._image, (x, y))
+        try:
+            backing = backing.convert()
+        except pygame.error:
+            pass
+        self._tiled = backing
+
+    def perform_draw(self, surface, *args, **kwargs):
+        self._ox = (self._ox + self.vel_x) % self._image.get_width()
+        self._oy = (self._oy + self.vel_y) % self._image.get_height()
+        surface.blit(self._tiled, (0, 0), pygame.Rect(self._ox, self._oy, self.win_width, self.win_height))
+
+
 class Sprite(Image):
     """
     Image subclass for handling sprite sheets.
@@ -488,6 +741,8 @@ class Sprite(Image):
         frame = sheet.get_frame(0, 1)
     """
 
+    __slots__ = ("frame_width", "frame_height")
+
     def __init__(
         self,
         image: str | Surface,
@@ -25,7 +25,8 @@ class SpriteSheet:
         num_frames (Optional[int]): Number of frames to extract.
 
     Attributes:
-        _frames (List[Image]): List of extracted frames as Image objects.
+        _surfaces (List[pygame.Surface]): Extracted frame surfaces.
+        _images (Dict[int, Image]): Image wrappers, built lazily per index.
     """
 
     @overload
@@ -43,44 +44,61 @@ class SpriteSheet:
         frame_size: tuple[int, int] = (64, 80),
         num_frames: int = None,
     ):
-        self._frames: list[Image] = [Image(img) for img in splitsheet(image, frame_size, num_frames)]
+        # Frames are kept as raw surfaces; an Image wrapper per frame is
+        # only built when something asks for that index, so loading a big
+        # sheet costs the split alone.
+        self._surfaces: list[pygame.Surface] = list(splitsheet(image, frame_size, num_frames))
+        self._images: dict[int, Image] = {}
+        self._frame_count = len(self._surfaces)
+
+    def _normalize_index(self, frame_idx: int) -> int:
+        """Map negative indices onto their positive positions so the wrapper cache has one key per frame."""
+        if frame_idx < 0:
+            frame_idx += self._frame_count
+        return frame_idx
 
     def __call__(self):
-        return iter(self._frames)
+        return iter(self.frames())
 
     def __iter__(self):
-        return iter(self._frames)
+        return iter(self.frames())
 
     def __setitem__(self, frame_idx: int, frame: Image):
-        if frame_idx >= len(self):
-            raise IndexError("Frame index out of range.")
-        self._frames[frame_idx] = frame
+        frame_idx = self._normalize_index(frame_idx)
+        self._surfaces[frame_idx] = frame.image
+        self._images[frame_idx] = frame
 
     def __getitem__(self, frame_idx: int) -> Image:
-        if frame_idx >= len(self):
-            raise IndexError("Frame index out of range.")
-        return self._frames[frame_idx]
+        frame_idx = self._normalize_index(frame_idx)
+        frame = self._images.get(frame_idx)
+        if frame is None:
+            frame = Image(self._surfaces[frame_idx])
+            self._images[frame_idx] = frame
+        return frame
 
     def __delitem__(self, frame_idx: int):
-        if frame_idx >= len(self):
-            raise IndexError("Frame index out of range.")
-        return self._frames.pop(frame_idx)
+        frame_idx = self._normalize_index(frame_idx)
+        frame = self[frame_idx]
+        self._surfaces.pop(frame_idx)
+        self._images.clear()  # cached wrappers are keyed by index
+        self._frame_count -= 1
+        return frame
 
     def __contains__(self, frame: Image) -> bool:
-        return frame in self._frames
+        return frame in self._images.values() or frame.image in self._surfaces
 
     def __bool__(self) -> bool:
-        return bool(self._frames)
+        return bool(self._surfaces)
 
     def __len__(self) -> int:
-        return len(self._frames)
+        return self._frame_count
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}({len(self)} frames)>"
 
     def get_frame(self, i: int) -> Image:
         """Get frame at index (wraps around if out of range)."""
-        return self.frames()[i % len(self.frames())]
+        return self[i % self._frame_count]
 
     def addframe(
         self,
@@ -99,8 +117,8 @@ class SpriteSheet:
             num_frames (int): Number of frames to add.
         """
         new_sheet = SpriteSheet(sheet, (frame_width, frame_height), num_frames)
-        frames = new_sheet.frames()
-        self._frames.extend(frames)
+        self._surfaces.extend(new_sheet.images())
+        self._frame_count = len(self._surfaces)
 
     def removeframe(self, frame_idx: int) -> Image:
         """
@@ -112,7 +130,9 @@ class SpriteSheet:
         Returns:
             Image: The removed frame.
         """
-        return self.frames().pop(frame_idx)
+        frame = self[frame_idx]
+        del self[frame_idx]
+        return frame
 
     def getframe(self, frame_idx: int) -> Image:
         """
@@ -124,7 +144,7 @@ class SpriteSheet:
         Returns:
             Image: The frame at the index.
         """
-        return self.frames()[frame_idx]
+        return self[frame_idx]
 
     def getimage(self, frame_idx: int) -> pygame.Surface:
         """
@@ -136,15 +156,15 @@ class SpriteSheet:
         Returns:
             pygame.Surface: The surface of the frame.
         """
-        return self.images()[frame_idx]
+        return self._surfaces[frame_idx]
 
     def frames(self) -> list[Image]:
-        """Return all frames as Image objects."""
-        return self._frames
+        """Return all frames as Image objects (built and cached on demand)."""
+        return [self[i] for i in range(self._frame_count)]
 
     def images(self) -> list[pygame.Surface]:
         """Return all frames as pygame.Surface objects."""
-        return [frame.image for frame in self._frames]
+        return list(self._surfaces)
 
 
 class SheetAnimator(Animator):
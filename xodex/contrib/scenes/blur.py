@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import math
 from abc import ABC
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Literal
 
 import pygame
@@ -15,6 +17,63 @@ from pygame import time
 
 from xodex.scene.base import BaseScene
 
+try:
+    from numba import njit
+    from numba import prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+
+@lru_cache(maxsize=32)
+def _gauss_weights(radius: int) -> tuple[float, ...]:
+    """Normalized 1-D Gaussian weights for a given integer radius."""
+    sigma = max(radius * 0.5, 0.1)
+    inv = 1.0 / (2.0 * sigma * sigma)
+    weights = [math.exp(-(i * i) * inv) for i in range(-radius, radius + 1)]
+    total = sum(weights)
+    return tuple(w / total for w in weights)
+
+
+def _sep_gauss(src, tmp, dst, kernel):  # pragma: no cover - compiled
+    """Two clamped 1-D convolution passes (horizontal into tmp, vertical into dst)."""
+    width, height, channels = src.shape
+    taps = kernel.shape[0]
+    radius = taps // 2
+    for x in prange(width):  # pylint: disable=not-an-iterable
+        for y in range(height):
+            for ch in range(channels):
+                acc = 0.0
+                for i in range(taps):
+                    xx = x + i - radius
+                    if xx < 0:
+                        xx = 0
+                    elif xx >= width:
+                        xx = width - 1
+                    acc += src[xx, y, ch] * kernel[i]
+                tmp[x, y, ch] = acc
+    for x in prange(width):  # pylint: disable=not-an-iterable
+        for y in range(height):
+            for ch in range(channels):
+                acc = 0.0
+                for i in range(taps):
+                    yy = y + i - radius
+                    if yy < 0:
+                        yy = 0
+                    elif yy >= height:
+                        yy = height - 1
+                    acc += tmp[x, yy, ch] * kernel[i]
+                dst[x, y, ch] = acc
+
+
+if HAS_NUMBA:
+    _sep_gauss = njit(parallel=True, fastmath=True, cache=True)(_sep_gauss)
+
+# pygame-ce >= 2.2 ships an SIMD-accelerated separable blur; plain pygame does not.
+_pg_gaussian_blur = getattr(pygame.transform, "gaussian_blur", None)
+
 __all__ = (
     "BlurScene",
     "BoxBlurScene",
@@ -76,6 +135,14 @@ class BlurScene(BaseScene, ABC):
         self._blur_surface = blur_surface
         self._blur_paused = False
         self._blur_started = False
+        self._start_ms = time.get_ticks()
+        # 16.16 fixed-point radius-per-millisecond slope; the per-frame
+        # radius then needs one integer multiply and shift, no floats.
+        self._blur_slope_q = int(blur_count * 65536 / (blur_duration * 1000))
+        self._blur_arrays = None  # (src, tmp, dst) float32 scratch, allocated on first numba blur
+        self._blur_source = blur_surface
+        self._blur_cache: dict[int, Surface] = {}
+        self._last_radius = -1
 
     def update_scene(self, deltatime: float, *args, **kwargs) -> None:
         """
@@ -88,15 +155,20 @@ class BlurScene(BaseScene, ABC):
             if not self._blur_started and self._on_blur_start:
                 self._on_blur_start()
                 self._blur_started = True
-            blur_time = time.get_ticks() / 1000
-            min_blur = min(
-                (blur_time - self._start_time) * self._blur_count / self._blur_duration,
-                self._blur_count,
-            )
-            self._blur_surface = self.blur(min_blur)
+            q = (self._frame_ticks - self._start_ms) * self._blur_slope_q
+            radius = q >> 16
+            if radius > self._blur_count:
+                radius = self._blur_count
+            if radius != self._last_radius:
+                cached = self._blur_cache.get(radius)
+                if cached is None:
+                    self._blur_surface = self._blur_source
+                    cached = self._blur_cache[radius] = self.blur(radius)
+                self._blur_surface = cached
+                self._last_radius = radius
             if self._on_blur_progress:
-                self._on_blur_progress(min_blur / self._blur_count)
-            self._blur_finished = min_blur == self._blur_count
+                self._on_blur_progress(min(q / 65536.0, self._blur_count) / self._blur_count)
+            self._blur_finished = radius == self._blur_count
             if self._blur_finished and self._on_blur_complete:
                 self._on_blur_complete()
         super().update_scene(deltatime, *args, **kwargs)
@@ -106,15 +178,20 @@ class BlurScene(BaseScene, ABC):
         Async version of update_scene.
         """
         if not self._blur_finished and not self._blur_paused:
-            blur_time = time.get_ticks() / 1000
-            min_blur = min(
-                (blur_time - self._start_time) * self._blur_count / self._blur_duration,
-                self._blur_count,
-            )
-            self._blur_surface = await self.async_blur(min_blur)
+            q = (self._frame_ticks - self._start_ms) * self._blur_slope_q
+            radius = q >> 16
+            if radius > self._blur_count:
+                radius = self._blur_count
+            if radius != self._last_radius:
+                cached = self._blur_cache.get(radius)
+                if cached is None:
+                    self._blur_surface = self._blur_source
+                    cached = self._blur_cache[radius] = await self.async_blur(radius)
+                self._blur_surface = cached
+                self._last_radius = radius
             if self._on_blur_progress:
-                self._on_blur_progress(min_blur / self._blur_count)
-            self._blur_finished = min_blur == self._blur_count
+                self._on_blur_progress(min(q / 65536.0, self._blur_count) / self._blur_count)
+            self._blur_finished = radius == self._blur_count
             if self._blur_finished and self._on_blur_complete:
                 self._on_blur_complete()
         await super().async_update_scene(deltatime, *args, **kwargs)
@@ -126,15 +203,16 @@ class BlurScene(BaseScene, ABC):
         Returns:
             pygame.Surface: The updated scene surface.
         """
-        self._screen.blit(self._blur_surface, self._screen.get_rect())
-        self._objects.draw_object(self._screen, *args, **kwargs)
-        return self._screen
+        self.screen.blit(self._blur_surface, (0, 0))
+        self._objects.draw_object(self.screen, *args, **kwargs)
+        return self.screen
 
     def reset_blur(self):
         """Restart the blur effect."""
-        self._start_time = time.get_ticks() / 1000
+        self._start_ms = time.get_ticks()
         self._blur_finished = False
         self._blur_started = False
+        self._last_radius = -1
 
     def is_blur_finished(self) -> bool:
         """Return True if blurring finished."""
@@ -164,6 +242,16 @@ class BlurScene(BaseScene, ABC):
         Returns:
             Surface: Blurred surface.
         """
+        if self._blur_type == "gaussian" and not self._blur_region and not self._blur_mask:
+            radius = int(blur_count)
+            if radius <= 0:
+                return self._blur_surface.convert()
+            if _pg_gaussian_blur is not None:
+                return _pg_gaussian_blur(self._blur_surface, radius)
+            if HAS_NUMBA:
+                return self._numba_gaussian(radius)
+            return self._smoothscale_blur(radius)
+
         mode = "RGBA"
         size = self._blur_surface.get_size()
         raw = image.tostring(self._blur_surface, mode)
@@ -185,6 +273,42 @@ class BlurScene(BaseScene, ABC):
         surf = image.fromstring(impil.tobytes(), impil.size, mode).convert()
         return surf
 
+    def _smoothscale_blur(self, radius: int) -> Surface:
+        """
+        Approximate a Gaussian by smoothscaling down by the radius and back
+        up. Both passes are SDL box filters, so the cost is O(W*H) no
+        matter how large the radius gets.
+        """
+        width, height = self._blur_surface.get_size()
+        factor = max(1, radius)
+        small = pygame.transform.smoothscale(self._blur_surface, (max(1, width // factor), max(1, height // factor)))
+        return pygame.transform.smoothscale(small, (width, height))
+
+    def _numba_gaussian(self, radius: int) -> Surface:
+        """
+        Full-surface Gaussian through a compiled separable convolution.
+
+        Works on a NumPy copy of the pixels with reusable float32 scratch
+        buffers, so the per-frame cost is the two 1-D passes — no PIL
+        bytes roundtrip and no fresh allocations after the first call.
+        """
+        import numpy as np
+
+        if radius <= 0:
+            return self._blur_surface.convert()
+        arr = pygame.surfarray.array3d(self._blur_surface)
+        if self._blur_arrays is None or self._blur_arrays[0].shape != arr.shape:
+            self._blur_arrays = (
+                np.empty(arr.shape, dtype=np.float32),
+                np.empty(arr.shape, dtype=np.float32),
+                np.empty(arr.shape, dtype=np.float32),
+            )
+        src, tmp, dst = self._blur_arrays
+        src[:] = arr
+        kernel = np.asarray(_gauss_weights(radius), dtype=np.float32)
+        _sep_gauss(src, tmp, dst, kernel)
+        return pygame.surfarray.make_surface(dst.astype(np.uint8)).convert()
+
     async def async_blur(self, blur_count: int = 5) -> Surface:
         """
         Async version of blur.
@@ -36,6 +36,7 @@ import os
 import sys
 import time
 from importlib import import_module
+from importlib.util import find_spec
 
 import pygame
 from pygame.event import Event
@@ -120,10 +121,8 @@ class Game(Singleton):
         self._debug_overlay = False
         self._custom_event_handler = None
 
-        flags = pygame.SCALED | pygame.RESIZABLE
-        if self._fullscreen:
-            flags |= pygame.FULLSCREEN
-        self.__screen = pygame.display.set_mode(self._size, flags=flags)
+        self._display_mode = None
+        self._apply_display_mode()
 
         self.__clock = pygame.time.Clock()
         self.ready = self.objects_ready = self.scenes_ready = False
@@ -139,6 +138,21 @@ class Game(Singleton):
 
     # region Window/Display
 
+    def _apply_display_mode(self) -> None:
+        """
+        (Re)create the display surface for the current size and fullscreen state.
+
+        Skips the `pygame.display.set_mode` call entirely when the requested
+        mode matches the one already set, avoiding redundant display
+        re-initialization (e.g. at startup when `setup()` runs after `__init__`).
+        """
+        flags = pygame.SCALED | pygame.RESIZABLE | (pygame.FULLSCREEN if self._fullscreen else 0)
+        mode = (tuple(self._size), flags)
+        if self._display_mode == mode:
+            return
+        self.__screen = pygame.display.set_mode(self._size, flags=flags)
+        self._display_mode = mode
+
     def set_caption(self, caption: str):
         """
         Set the window caption/title.
@@ -166,10 +180,7 @@ class Game(Singleton):
     def toggle_fullscreen(self):
         """Toggle fullscreen/windowed mode."""
         self._fullscreen = not self._fullscreen
-        flags = pygame.SCALED | pygame.RESIZABLE
-        if self._fullscreen:
-            flags |= pygame.FULLSCREEN
-        self.__screen = pygame.display.set_mode(self._size, flags=flags)
+        self._apply_display_mode()
 
     def save_screenshot(self, filename: str = None):
         """
@@ -240,11 +251,22 @@ class Game(Singleton):
 
     def __process_all_events(self) -> None:
         """Process all Pygame events for the current frame, including scene and exit events."""
+        scene = SceneManager().current
+        # Drain resize events first; the per-event loop below then stays
+        # branch-free on the common no-resize frame.
+        for event in pygame.event.get(pygame.VIDEORESIZE):
+            scene._on_resize(event.size)
+            self._on_resize(event.size)
+        handle = scene.handle_scene
         for event in pygame.event.get():
-            SceneManager().current.handle_scene(event)
-            self.__process_exit_events(event)
+            # Backstop for a resize posted between the prefilter and this
+            # drain; without it that event would be silently dropped.
             if event.type == pygame.VIDEORESIZE:
+                scene._on_resize(event.size)
                 self._on_resize(event.size)
+                continue
+            handle(event)
+            self.__process_exit_events(event)
 
     def __process_all_logic(self, delta: float) -> None:
         """
@@ -253,11 +275,19 @@ class Game(Singleton):
         Args:
             delta (float): Time elapsed since the last frame in milliseconds.
         """
-
-        SceneManager().current.update_scene(delta)
+        scene = SceneManager().current
+        scene._tick()
+        scene.update_scene(delta)
 
     def __process_all_draw(self) -> None:
         """Draw the current scene and overlays to the screen."""
+        scene = SceneManager().current
+        if scene._dirty_only:
+            # Dirty-rect scenes present only the changed regions; the
+            # backdrop fill, overlays and full flip are skipped.
+            self.__screen.blit(scene.draw_scene(), (0, 0))
+            pygame.display.update(scene.consume_dirty_rects())
+            return
         self.__screen.fill((255, 55, 23))
         self.__screen.blit(SceneManager().current.draw_scene(), (0, 0))
         if self._debug:
@@ -276,7 +306,9 @@ class Game(Singleton):
         Args:
             delta (float): Time elapsed since the last frame in milliseconds.
         """
-        SceneManager().current.update_scene(delta)
+        scene = SceneManager().current
+        scene._tick()
+        scene.update_scene(delta)
 
     async def __process_all_draw_async(self):
         """Asynchronously draw the current scene and overlays to the screen."""
@@ -309,10 +341,7 @@ class Game(Singleton):
             size (tuple): The new window size as (width, height).
         """
         self._size = size
-        flags = pygame.SCALED | pygame.RESIZABLE
-        if self._fullscreen:
-            flags |= pygame.FULLSCREEN
-        self.__screen = pygame.display.set_mode(self._size, flags=flags)
+        self._apply_display_mode()
         if self._debug:
             print(f"Window resized to: {self._size}")
 
@@ -359,11 +388,8 @@ class Game(Singleton):
             self._mainscene = settings.MAIN_SCENE
             self._show_fps = settings.SHOW_FPS
 
-            # Update window properties
-            flags = pygame.SCALED | pygame.RESIZABLE
-            if self._fullscreen:
-                flags |= pygame.FULLSCREEN
-            self.__screen = pygame.display.set_mode(self._size, flags)
+            # Update window properties (set_mode is skipped when unchanged)
+            self._apply_display_mode()
             pygame.display.set_caption(self._caption)
             if self._icon:
                 self.set_icon(self._icon)
@@ -371,23 +397,31 @@ class Game(Singleton):
             # Import the main game module as specified in settings
             game_module = import_module(settings.PROJECT)
 
-            # Import user objects module
+            # Import user objects module (find_spec avoids ImportError cost when absent)
+            import_path = f"{game_module.__name__}.objects"
             try:
-                import_path = f"{game_module.__name__}.objects"
+                spec = find_spec(import_path)
+            except ModuleNotFoundError:  # settings.PROJECT is a plain module, not a package
+                spec = None
+            if spec is not None:
                 import_module(import_path)
                 logging.info(f"Registered user objects from {import_path}")
                 self.objects_ready = True
-            except ImportError:
+            else:
                 logging.warning("No user objects module found.")
                 self.objects_ready = False
 
             # Import user scenes module
+            import_path = f"{game_module.__name__}.scenes"
             try:
-                import_path = f"{game_module.__name__}.scenes"
+                spec = find_spec(import_path)
+            except ModuleNotFoundError:  # settings.PROJECT is a plain module, not a package
+                spec = None
+            if spec is not None:
                 import_module(import_path)
                 logging.info(f"Registered user scenes from {import_path}")
                 self.scenes_ready = True
-            except ImportError:
+            else:
                 logging.warning("No user scenes module found.")
                 self.scenes_ready = False
 
@@ -43,6 +43,7 @@ class Sounds(Singleton):
         self.sound_folder = None
         self.sound_folder = settings.SOUND_DIR or folder
         self.__sounds: dict[str, Sound] = {}
+        self._sound_callbacks: dict[str, list] = {}
         self.load_sounds(self.sound_folder)
 
     def __len__(self) -> int:
@@ -143,10 +144,29 @@ class Sounds(Singleton):
                 ch = Sounds._channels[channel].play(snd, loops, maxtime, fade_ms)
             if ch and on_end and hasattr(ch, "set_endevent"):
                 ch.set_endevent(on_end)
+            if self._sound_callbacks:
+                self._trigger_callbacks(sound)
             return ch
         except KeyError:
             print(f"Sound or channel '{sound}'/'{channel}' not found.")
 
+    def on_play(self, sound_name: str, callback) -> None:
+        """
+        Register a callback to run whenever a sound is played.
+
+        :param sound_name: Registered sound name.
+        :param callback: Callable invoked with the sound name.
+        """
+        self._sound_callbacks.setdefault(sound_name, []).append(callback)
+
+    def _trigger_callbacks(self, sound_name: str) -> None:
+        """Run play callbacks for a sound, skipping cheaply when none exist."""
+        cbs = self._sound_callbacks.get(sound_name)
+        if not cbs:
+            return
+        for cb in cbs:
+            cb(sound_name)
+
     def stop(self, sound: str):
         """
         Stop a sound by name and its channel if exists.
@@ -9,6 +9,7 @@ Defines base classes for game objects:
 from __future__ import annotations
 
 import time
+import weakref
 from abc import ABC
 from abc import abstractmethod
 
@@ -17,12 +18,86 @@ from pygame.event import Event
 
 __all__ = ("Object", "DrawableObject", "EventfulObject", "LogicalObject")
 
+# Bound once: the per-frame paths below pay a LOAD_FAST instead of a
+# module-global plus attribute lookup for every timestamp.
+_perf_counter = time.perf_counter
+
+
+class _ProfileRing:
+    """
+    Fixed-size ring of recent timings.
+
+    Recording writes one float into a preallocated list — no tuple or
+    kwargs boxing per sample — so profiling a hot loop does not itself
+    create per-frame garbage. Readers take samples() for the most recent
+    window.
+    """
+
+    __slots__ = ("_samples", "_idx")
+
+    def __init__(self, size: int = 256):
+        self._samples = [0.0] * size
+        self._idx = 0
+
+    def record(self, elapsed: float) -> None:
+        """Store one timing, overwriting the oldest once the ring is full."""
+        samples = self._samples
+        samples[self._idx % len(samples)] = elapsed
+        self._idx += 1
+
+    def samples(self) -> list[float]:
+        """Return the recorded timings, oldest first."""
+        if self._idx < len(self._samples):
+            return self._samples[: self._idx]
+        split = self._idx % len(self._samples)
+        return self._samples[split:] + self._samples[:split]
+
 
 class BaseObject:
     """Base class for all game objects."""
 
+    # The only non-empty slot tuple in the hierarchy: subclasses stay
+    # slottable without layout conflicts, instances stay weak-referencable
+    # (the animator registry holds them in a WeakSet), and subclasses that
+    # declare no __slots__ of their own still get a __dict__ as usual.
+    __slots__ = ("__weakref__",)
+
+
+class Object(BaseObject):
+    """Common ancestor for registrable game objects."""
+
+    __slots__ = ()
+
+    # Every subclass, recorded at class-creation time so registries can
+    # validate membership with an O(1) set test instead of an MRO walk.
+    _subclasses: weakref.WeakSet[type] = weakref.WeakSet()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Object._subclasses.add(cls)
+
 
-class Object(BaseObject): ...
+def _update_bare(self, deltatime: float, *args, **kwargs) -> None:
+    """update_xodex_object specialized for default hooks and no error handler."""
+    if not self.update_enabled:
+        return
+    if self.update_profile:
+        LogicalObject.update_xodex_object(self, deltatime, *args, **kwargs)
+        return
+    self.perform_update(deltatime, *args, **kwargs)
+
+
+def _update_fused(self, deltatime: float, *args, **kwargs) -> None:
+    """update_xodex_object specialized for subclasses with default no-op hooks."""
+    if not self.update_enabled:
+        return
+    if self.update_profile:
+        LogicalObject.update_xodex_object(self, deltatime, *args, **kwargs)
+        return
+    try:
+        self.perform_update(deltatime, *args, **kwargs)
+    except Exception as exc:
+        self.on_update_error(exc)
 
 
 class LogicalObject(Object, ABC):
@@ -43,8 +118,38 @@ class LogicalObject(Object, ABC):
     - Update error handling hook.
     """
 
+    # Empty: the flags above stay class-level defaults (a slot of the same
+    # name would shadow them); subclasses that toggle them per instance
+    # need a __dict__, which non-slotted subclasses get automatically.
+    __slots__ = ()
+
     update_enabled: bool = True  # Toggle updating on/off
     update_profile: bool = False  # Enable profiling of update time
+    update_profile_ring: _ProfileRing = _ProfileRing()  # Shared; override on a subclass for a private ring
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Only (re)specialize when the MRO-resolved dispatch is one we
+        # installed ourselves; a user override anywhere in the hierarchy
+        # (not just on cls) must stay in force for further subclasses.
+        if cls.update_xodex_object not in (
+            LogicalObject.update_xodex_object,
+            _update_bare,
+            _update_fused,
+        ):
+            return
+        # When both hooks are still the base no-ops, the three-phase
+        # dispatch is two empty calls per object per frame; fuse it. With
+        # no error handler either, skip the try/except prologue as well —
+        # exceptions then propagate instead of being swallowed by the
+        # default no-op hook.
+        if cls.before_update is LogicalObject.before_update and cls.after_update is LogicalObject.after_update:
+            if cls.on_update_error is LogicalObject.on_update_error:
+                cls.update_xodex_object = _update_bare
+            else:
+                cls.update_xodex_object = _update_fused
+        else:
+            cls.update_xodex_object = LogicalObject.update_xodex_object
 
     def update_xodex_object(self, deltatime: float, *args, **kwargs) -> None:
         """
@@ -55,9 +160,9 @@ class LogicalObject(Object, ABC):
             *args: Additional positional arguments.
             **kwargs: Additional keyword arguments.
         """
-        if not getattr(self, "update_enabled", True):
+        if not self.update_enabled:
             return
-        start_time = time.perf_counter() if getattr(self, "update_profile", False) else None
+        start_time = _perf_counter() if self.update_profile else None
         try:
             self.before_update()
             self.perform_update(deltatime, *args, **kwargs)
@@ -66,8 +171,10 @@ class LogicalObject(Object, ABC):
             self.on_update_error(exc)
         finally:
             if start_time is not None:
-                elapsed = time.perf_counter() - start_time
-                self.on_update_profile(elapsed, *args, **kwargs)
+                elapsed = _perf_counter() - start_time
+                self.update_profile_ring.record(elapsed)
+                if type(self).on_update_profile is not LogicalObject.on_update_profile:
+                    self.on_update_profile(elapsed, *args, **kwargs)
 
     @abstractmethod
     def perform_update(self, deltatime: float, *args, **kwargs) -> None:
@@ -109,6 +216,29 @@ class LogicalObject(Object, ABC):
         # Override to log or handle update errors.
 
 
+def _draw_bare(self, surface: Surface, *args, **kwargs) -> None:
+    """draw_xodex_object specialized for default hooks and no error handler."""
+    if not self.draw_enabled:
+        return
+    if self.draw_profile:
+        DrawableObject.draw_xodex_object(self, surface, *args, **kwargs)
+        return
+    self.perform_draw(surface, *args, **kwargs)
+
+
+def _draw_fused(self, surface: Surface, *args, **kwargs) -> None:
+    """draw_xodex_object specialized for subclasses with default no-op hooks."""
+    if not self.draw_enabled:
+        return
+    if self.draw_profile:
+        DrawableObject.draw_xodex_object(self, surface, *args, **kwargs)
+        return
+    try:
+        self.perform_draw(surface, *args, **kwargs)
+    except Exception as exc:
+        self.on_draw_error(exc)
+
+
 class DrawableObject(Object, ABC):
     """
     Abstract base class for drawable game objects.
@@ -128,9 +258,31 @@ class DrawableObject(Object, ABC):
     - Supports visibility toggling.
     """
 
+    __slots__ = ()
+
     visible: bool = True
     draw_enabled: bool = True  # Toggle drawing on/off
     draw_profile: bool = False  # Enable profiling of draw time
+    draw_profile_ring: _ProfileRing = _ProfileRing()  # Shared; override on a subclass for a private ring
+    z_index: int = 0  # Draw order; containers cache the sorted order (see Objects.mark_draw_dirty)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # As in LogicalObject: leave user overrides of the dispatch method,
+        # inherited or not, alone.
+        if cls.draw_xodex_object not in (
+            DrawableObject.draw_xodex_object,
+            _draw_bare,
+            _draw_fused,
+        ):
+            return
+        if cls.before_draw is DrawableObject.before_draw and cls.after_draw is DrawableObject.after_draw:
+            if cls.on_draw_error is DrawableObject.on_draw_error:
+                cls.draw_xodex_object = _draw_bare
+            else:
+                cls.draw_xodex_object = _draw_fused
+        else:
+            cls.draw_xodex_object = DrawableObject.draw_xodex_object
 
     def draw_xodex_object(self, surface: Surface, *args, **kwargs) -> None:
         """
@@ -142,9 +294,9 @@ class DrawableObject(Object, ABC):
             **kwargs: Additional keyword arguments.
         """
 
-        if not getattr(self, "draw_enabled", True):
+        if not self.draw_enabled:
             return
-        start_time = time.perf_counter() if getattr(self, "draw_profile", False) else None
+        start_time = _perf_counter() if self.draw_profile else None
         try:
             self.before_draw()
             self.perform_draw(surface, *args, **kwargs)
@@ -153,8 +305,10 @@ class DrawableObject(Object, ABC):
             self.on_draw_error(exc)
         finally:
             if start_time is not None:
-                elapsed = time.perf_counter() - start_time
-                self.on_draw_profile(elapsed, surface, *args, **kwargs)
+                elapsed = _perf_counter() - start_time
+                self.draw_profile_ring.record(elapsed)
+                if type(self).on_draw_profile is not DrawableObject.on_draw_profile:
+                    self.on_draw_profile(elapsed, surface, *args, **kwargs)
 
     @abstractmethod
     def perform_draw(self, surface: Surface, *args, **kwargs) -> None:
@@ -198,6 +352,29 @@ class DrawableObject(Object, ABC):
         # Override to log or handle draw errors.
 
 
+def _event_bare(self, event: Event, *args, **kwargs) -> None:
+    """handle_xodex_event specialized for default hooks and no error handler."""
+    if not self.event_enabled:
+        return
+    if self.event_profile:
+        EventfulObject.handle_xodex_event(self, event, *args, **kwargs)
+        return
+    self.handle_event(event, *args, **kwargs)
+
+
+def _event_fused(self, event: Event, *args, **kwargs) -> None:
+    """handle_xodex_event specialized for subclasses with default no-op hooks."""
+    if not self.event_enabled:
+        return
+    if self.event_profile:
+        EventfulObject.handle_xodex_event(self, event, *args, **kwargs)
+        return
+    try:
+        self.handle_event(event, *args, **kwargs)
+    except Exception as exc:
+        self.on_event_error(exc)
+
+
 class EventfulObject(Object, ABC):
     """
     Abstract base class for eventful game objects.
@@ -216,8 +393,29 @@ class EventfulObject(Object, ABC):
     - Optional event profiling and error handling.
     """
 
+    __slots__ = ()
+
     event_profile: bool = False
     event_enabled: bool = True  # Toggle Interaction on/off
+    event_profile_ring: _ProfileRing = _ProfileRing()  # Shared; override on a subclass for a private ring
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # As in LogicalObject: leave user overrides of the dispatch method,
+        # inherited or not, alone.
+        if cls.handle_xodex_event not in (
+            EventfulObject.handle_xodex_event,
+            _event_bare,
+            _event_fused,
+        ):
+            return
+        if cls.before_event is EventfulObject.before_event and cls.after_event is EventfulObject.after_event:
+            if cls.on_event_error is EventfulObject.on_event_error:
+                cls.handle_xodex_event = _event_bare
+            else:
+                cls.handle_xodex_event = _event_fused
+        else:
+            cls.handle_xodex_event = EventfulObject.handle_xodex_event
 
     def handle_xodex_event(self, event: Event, *args, **kwargs) -> None:
         """
@@ -228,10 +426,10 @@ class EventfulObject(Object, ABC):
             *args: Additional positional arguments.
             **kwargs: Additional keyword arguments.
         """
-        if not getattr(self, "event_enabled", True):
+        if not self.event_enabled:
             return
 
-        start_time = time.perf_counter() if getattr(self, "event_profile", False) else None
+        start_time = _perf_counter() if self.event_profile else None
         try:
             self.before_event()
             self.handle_event(event, *args, **kwargs)
@@ -240,8 +438,10 @@ class EventfulObject(Object, ABC):
             self.on_event_error(exc)
         finally:
             if start_time is not None:
-                elapsed = time.perf_counter() - start_time
-                self.on_event_profile(elapsed, event, *args, **kwargs)
+                elapsed = _perf_counter() - start_time
+                self.event_profile_ring.record(elapsed)
+                if type(self).on_event_profile is not EventfulObject.on_event_profile:
+                    self.on_event_profile(elapsed, event, *args, **kwargs)
 
     @abstractmethod
     def handle_event(self, event: Event, *args, **kwargs) -> None:
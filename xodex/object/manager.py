@@ -6,15 +6,21 @@ Provides scene-based registration and querying of game objects.
 from __future__ import annotations
 
 import asyncio
+import sys
 from collections.abc import Callable
+from functools import lru_cache
+from importlib import import_module
+from types import MappingProxyType
 
 from xodex.core.exceptions import AlreadyRegistered
 from xodex.core.exceptions import NotRegistered
 from xodex.core.exceptions import ObjectError
+from xodex.object.base import DrawableObject
+from xodex.object.base import EventfulObject
+from xodex.object.base import LogicalObject
 from xodex.object.base import Object
 from xodex.utils.log import get_xodex_logger
 from xodex.utils.singleton import Singleton
-from xodex.utils.values import Values
 
 __all__ = ("ObjectsManager", "register")
 
@@ -22,7 +28,7 @@ __all__ = ("ObjectsManager", "register")
 logger = get_xodex_logger(__name__)
 
 
-class BaseManager(Singleton):
+class BaseManager(Singleton, dict):
     """
     Objects registry for game objects.
 
@@ -40,21 +46,29 @@ class BaseManager(Singleton):
         manager.unregister("MyObject")
     """
 
+    # Capability bits precomputed at registration time.
+    _CAP_DRAWABLE = 1
+    _CAP_EVENTFUL = 2
+    _CAP_LOGICAL = 4
+
     def __init__(self):
-        self.__object_classes: dict[str, type[Object]] = {}
+        dict.__init__(self)
+        self._caps: dict[str, int] = {}
+        self._lazy: dict[str, tuple[str, str]] = {}
         self._user_hooks: dict[str, list[Callable]] = {}
+        self._registry_view = MappingProxyType(self)
 
     # region Properties
 
     @property
     def all(self) -> list[type[Object]]:
         """Return a list of all registered object classes."""
-        return list(self.__object_classes.values())
+        return list(self.values())
 
     @property
     def count(self) -> int:
         """Return the number of registered object classes."""
-        return len(self.__object_classes)
+        return len(self)
 
     # endregion
 
@@ -69,14 +83,45 @@ class BaseManager(Singleton):
             ObjectError: If the class is not a subclass of Object.
         """
         self._run_hook("before_register", object_class, object_name)
-        if not issubclass(object_class, Object):
+        # Membership in the WeakSet filled by Object.__init_subclass__ is an
+        # O(1) test where issubclass walks the MRO on every registration.
+        if object_class is not Object and object_class not in Object._subclasses:
             raise ObjectError(f"{object_class} is not a subclass of Object.")
         if self.is_registered(object_name):
             raise AlreadyRegistered(f"The Object '{object_name}' is already registered.")
-        self.__object_classes[object_name] = object_class
+        # Interned keys let dict probes short-circuit on identity against
+        # the compiler-interned literals callers typically pass.
+        object_name = sys.intern(object_name)
+        self[object_name] = object_class
+        self._caps[object_name] = (
+            (self._CAP_DRAWABLE if issubclass(object_class, DrawableObject) else 0)
+            | (self._CAP_EVENTFUL if issubclass(object_class, EventfulObject) else 0)
+            | (self._CAP_LOGICAL if issubclass(object_class, LogicalObject) else 0)
+        )
         logger.info(f"Registered object '{object_name}'.")
+        _get_object_cached.cache_clear()
         self._run_hook("after_register", object_class, object_name)
 
+    def register_lazy(self, object_name: str, import_path: str, attr: str | None = None) -> None:
+        """
+        Register an object class by dotted import path without importing it.
+
+        The module is imported and the class validated on the first
+        get_object() call for the name, keeping optional widget packs off
+        the startup path.
+
+        Args:
+            object_name: Name to register under.
+            import_path: Dotted module path holding the class.
+            attr: Attribute name in the module (defaults to object_name).
+
+        Raises:
+            AlreadyRegistered: If the name is already registered.
+        """
+        if self.is_registered(object_name):
+            raise AlreadyRegistered(f"The Object '{object_name}' is already registered.")
+        self._lazy[sys.intern(object_name)] = (import_path, attr or object_name)
+
     def unregister(self, object_name: str) -> None:
         """
         Unregister an object class by name.
@@ -87,13 +132,16 @@ class BaseManager(Singleton):
         self._run_hook("before_unregister", object_name)
         if not self.is_registered(object_name):
             raise NotRegistered(f"The Object '{object_name}' is not registered.")
-        del self.__object_classes[object_name]
+        if self._lazy.pop(object_name, None) is None:
+            del self[object_name]
+            del self._caps[object_name]
         logger.info(f"Unregistered object '{object_name}'.")
+        _get_object_cached.cache_clear()
         self._run_hook("after_unregister", object_name)
 
     def is_registered(self, object_name: str) -> bool:
         """Return True if an object is registered by name."""
-        return object_name in self.__object_classes
+        return object_name in self or object_name in self._lazy
 
     def get_object(self, object_name: str) -> type[Object]:
         """
@@ -102,19 +150,22 @@ class BaseManager(Singleton):
         Raises:
             KeyError: If the object is not registered.
         """
-        return self._get_object_(object_name)
+        return _get_object_cached(object_name)
 
-    def get_objects(self) -> Values:
-        """Get all registered object classes as a Values object."""
-        return Values(self.__object_classes)
+    def get_objects(self) -> MappingProxyType:
+        """Get a read-only live view of all registered object classes (zero-copy)."""
+        return self._registry_view
 
     def list_registered_object_classes(self) -> list[str]:
         """List all registered object class names."""
-        return list(self.__object_classes.keys())
+        return list(self.keys())
 
     def clear(self) -> None:
         """Remove all registered object classes."""
-        self.__object_classes.clear()
+        dict.clear(self)
+        self._caps.clear()
+        self._lazy.clear()
+        _get_object_cached.cache_clear()
         logger.info("Cleared all registered objects.")
 
     # endregion
@@ -131,12 +182,24 @@ class BaseManager(Singleton):
         Returns:
             The object class, or None if out of range.
         """
-        keys = list(self.__object_classes.keys())
+        keys = list(self.keys())
         if 0 <= index < len(keys):
-            return self.__object_classes[keys[index]]
+            return self[keys[index]]
         logger.warning(f"Object index {index} out of range.")
         return None
 
+    def get_drawables(self) -> list[type[Object]]:
+        """Return all registered DrawableObject subclasses (precomputed, no isinstance checks)."""
+        return self._classes_with_cap(self._CAP_DRAWABLE)
+
+    def get_eventfuls(self) -> list[type[Object]]:
+        """Return all registered EventfulObject subclasses (precomputed, no isinstance checks)."""
+        return self._classes_with_cap(self._CAP_EVENTFUL)
+
+    def get_logicals(self) -> list[type[Object]]:
+        """Return all registered LogicalObject subclasses (precomputed, no isinstance checks)."""
+        return self._classes_with_cap(self._CAP_LOGICAL)
+
     def find_object_by_class(self, cls: type[Object]) -> str | None:
         """
         Find the registered name for a given object class.
@@ -147,7 +210,7 @@ class BaseManager(Singleton):
         Returns:
             The registered name, or None if not found.
         """
-        for name, obj_cls in self.__object_classes.items():
+        for name, obj_cls in self.items():
             if obj_cls is cls:
                 return name
         return None
@@ -189,24 +252,41 @@ class BaseManager(Singleton):
 
     # region Private
 
+    def _classes_with_cap(self, bit: int) -> list[type[Object]]:
+        caps = self._caps
+        return [cls for name, cls in self.items() if caps[name] & bit]
+
     def _get_object_(self, object_name: str) -> type[Object]:
-        _object = self.__object_classes.get(object_name)
-        if _object is not None:
-            return _object
-        raise KeyError(f"{object_name} is not a valid Object")
+        try:
+            # One C-level probe on the hit path; misses are rare once the
+            # lru_cache in front of get_object is warm.
+            return self[object_name]
+        except KeyError:
+            lazy = self._lazy.pop(object_name, None)
+            if lazy is not None:
+                import_path, attr = lazy
+                object_class = getattr(import_module(import_path), attr)
+                self.register(object_class, object_name)
+                return object_class
+            raise KeyError(f"{object_name} is not a valid Object") from None
 
     # endregion
 
-    def __len__(self) -> int:
-        """Return the number of registered object classes."""
-        return len(self.__object_classes)
 
-    def __contains__(self, key: str) -> bool:
-        """Check if an object is registered by name."""
-        return key in self.__object_classes
+class ObjectsManager(BaseManager): ...
 
 
-class ObjectsManager(BaseManager): ...
+@lru_cache(maxsize=256)
+def _get_object_cached(object_name: str) -> type[Object]:
+    """
+    C-level memo in front of the registry lookup.
+
+    Hot callers (scene object generation, frame callbacks) repeat the same
+    names; the lru_cache wrapper answers those with a hash probe in C.
+    Invalidated by register/unregister/clear. Misses raise KeyError, which
+    lru_cache never caches.
+    """
+    return ObjectsManager()._get_object_(object_name)
 
 
 def register(cls=None, *, name: str = None):
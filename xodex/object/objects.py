@@ -9,6 +9,7 @@ Provides:
 from __future__ import annotations
 
 from collections.abc import Iterable
+from operator import attrgetter
 
 from pygame import Surface
 from pygame.event import Event
@@ -27,6 +28,11 @@ class Objects(list):
 
     def __init__(self):
         list.__init__(self)
+        self._draw_plan: tuple = ()
+        self._update_fns: tuple = ()
+        self._event_fns: tuple = ()
+        self._draw_dirty = True
+        self._fns_dirty = True
 
     # region Private
     def _check_type_(self, item):
@@ -36,8 +42,32 @@ class Objects(list):
     def __iadd__(self, other):
         for item in other:
             self._check_type_(item)
+        self._draw_dirty = True
+        self._fns_dirty = True
         return super().__iadd__(other)
 
+    def __setitem__(self, index, item):
+        if isinstance(index, slice):
+            items = []
+            for obj in item:
+                if isinstance(obj, type) and issubclass(obj, self._allowed_types_):
+                    obj = obj()
+                self._check_type_(obj)
+                items.append(obj)
+            item = items
+        else:
+            if isinstance(item, type) and issubclass(item, self._allowed_types_):
+                item = item()
+            self._check_type_(item)
+        self._draw_dirty = True
+        self._fns_dirty = True
+        super().__setitem__(index, item)
+
+    def __delitem__(self, index):
+        self._draw_dirty = True
+        self._fns_dirty = True
+        super().__delitem__(index)
+
     # endregion
 
     # region Public
@@ -47,6 +77,8 @@ class Objects(list):
         if isinstance(item, type) and issubclass(item, self._allowed_types_):
             item = item()
         self._check_type_(item)
+        self._draw_dirty = True
+        self._fns_dirty = True
         super().append(item)
 
     def insert(self, index, item) -> None:
@@ -54,6 +86,8 @@ class Objects(list):
         if isinstance(item, type) and issubclass(item, self._allowed_types_):
             item = item()
         self._check_type_(item)
+        self._draw_dirty = True
+        self._fns_dirty = True
         super().insert(index, item)
 
     def extend(self, iterable: Iterable) -> None:
@@ -64,25 +98,112 @@ class Objects(list):
                 item = item()
             self._check_type_(item)
             items.append(item)
+        self._draw_dirty = True
+        self._fns_dirty = True
         super().extend(items)
 
+    def remove(self, item) -> None:
+        """Remove an object and invalidate the cached dispatch tuples."""
+        self._draw_dirty = True
+        self._fns_dirty = True
+        super().remove(item)
+
+    def pop(self, index: int = -1):
+        """Pop an object and invalidate the cached dispatch tuples."""
+        self._draw_dirty = True
+        self._fns_dirty = True
+        return super().pop(index)
+
+    def clear(self) -> None:
+        """Remove all objects and invalidate the cached dispatch tuples."""
+        self._draw_dirty = True
+        self._fns_dirty = True
+        self._draw_plan = ()
+        self._update_fns = ()
+        self._event_fns = ()
+        super().clear()
+
+    def sort(self, *args, **kwargs) -> None:
+        """Sort in place and invalidate the cached dispatch tuples."""
+        self._draw_dirty = True
+        self._fns_dirty = True
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        """Reverse in place and invalidate the cached dispatch tuples."""
+        self._draw_dirty = True
+        self._fns_dirty = True
+        super().reverse()
+
+    def mark_draw_dirty(self) -> None:
+        """Invalidate the cached draw order (call after mutating an object's z_index)."""
+        self._draw_dirty = True
+
+    @staticmethod
+    def _build_draw_plan(drawables) -> tuple:
+        """
+        Build the z-ordered draw plan: runs of two or more plain Images
+        collapse into tuples that draw_object feeds to Surface.blits in
+        one C call; everything else stays a cached bound method.
+        """
+        try:
+            from xodex.contrib.objects.image import Image
+        except ImportError:
+            Image = None  # pylint: disable=invalid-name
+        plan: list = []
+        run: list = []
+        for item in drawables:
+            # Only exact Images batch: their whole draw is one blit, and
+            # profiling (which batching would skip) is off.
+            if Image is not None and type(item) is Image and not Image.draw_profile:
+                run.append(item)
+                continue
+            if len(run) > 1:
+                plan.append(tuple(run))
+            else:
+                plan.extend(o.draw_xodex_object for o in run)
+            run.clear()
+            plan.append(item.draw_xodex_object)
+        if len(run) > 1:
+            plan.append(tuple(run))
+        else:
+            plan.extend(o.draw_xodex_object for o in run)
+        return tuple(plan)
+
+    def _rebuild_fn_caches(self) -> None:
+        """Rebuild the bound-method tuples for update and event dispatch."""
+        self._update_fns = tuple(item.update_xodex_object for item in self if isinstance(item, LogicalObject))
+        self._event_fns = tuple(item.handle_xodex_event for item in self if isinstance(item, EventfulObject))
+        self._fns_dirty = False
+
     def update_object(self, deltatime: float, *args, **kwargs) -> None:
-        """Update all LogicalObjects."""
-        filtered: Iterable[LogicalObject] = filter(lambda x: isinstance(x, LogicalObject), self)
-        for object in filtered:
-            object.update_xodex_object(deltatime, *args, **kwargs)
+        """Update all LogicalObjects through the cached bound-method tuple."""
+        if self._fns_dirty:
+            self._rebuild_fn_caches()
+        for fn in self._update_fns:
+            fn(deltatime, *args, **kwargs)
 
     def draw_object(self, surface: Surface, *args, **kwargs) -> None:
-        """Draw all DrawableObjects, sorted by z_index if present."""
-        filtered: Iterable[DrawableObject] = filter(lambda x: isinstance(x, DrawableObject), self)
-        sorted_objs = filtered  # sorted(filtered, key=lambda object: getattr(object, "z_index", 0))
-        for object in sorted_objs:
-            object.draw_xodex_object(surface, *args, **kwargs)
+        """Draw all DrawableObjects, sorted by z_index (draw plan cached until invalidated)."""
+        if self._draw_dirty:
+            drawables = [item for item in self if isinstance(item, DrawableObject)]
+            drawables.sort(key=attrgetter("z_index"))
+            self._draw_plan = self._build_draw_plan(drawables)
+            self._draw_dirty = False
+        for entry in self._draw_plan:
+            if entry.__class__ is tuple:
+                # Pairs are packed fresh each frame so mutators that swap an
+                # image's surface or rect stay visible; draw_enabled is
+                # honored per image.
+                surface.blits([(o._image, o._img_rect) for o in entry if o.draw_enabled], doreturn=False)
+            else:
+                entry(surface, *args, **kwargs)
 
     def handle_object(self, event: Event, *args, **kwargs) -> None:
-        """Dispatch event to all EventfulObjects."""
-        filtered: Iterable[EventfulObject] = filter(lambda x: isinstance(x, EventfulObject), self)
-        for object in filtered:
-            object.handle_xodex_event(event, *args, **kwargs)
+        """Dispatch event to all EventfulObjects through the cached bound-method tuple."""
+        if self._fns_dirty:
+            self._rebuild_fn_caches()
+        for fn in self._event_fns:
+            fn(event, *args, **kwargs)
 
     # endregion
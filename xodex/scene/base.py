@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 
 import pygame
 from pygame.event import Event
+from pygame.time import get_ticks as _get_ticks
 
 from xodex.conf import settings
 from xodex.object import Object
@@ -19,6 +20,10 @@ from xodex.utils.log import get_xodex_logger
 
 logger = get_xodex_logger(__name__)
 
+# The singleton resolved once; per-frame callers skip the metaclass
+# __call__ dispatch that ObjectsManager() pays on every invocation.
+_objects_manager = ObjectsManager()
+
 if TYPE_CHECKING:
     from xodex.scene.manager import SceneManager
 
@@ -26,6 +31,10 @@ if TYPE_CHECKING:
 __all__ = ("BaseScene", "Scene")
 
 
+def _noop_hook(*args, **kwargs) -> None:
+    """Stands in for debug-only default hooks when debug logging is off."""
+
+
 class BaseScene(ABC):
     """
     Abstract base class for all scenes in the Xodex engine.
@@ -36,12 +45,12 @@ class BaseScene(ABC):
 
     Attributes:
         setting: The imported settings module (from XODEX_SETTINGS_MODULE).
-        _size (tuple[int, int]): The window size for the scene.
+        size (tuple[int, int]): The window size for the scene.
         _debug (bool): Debug mode flag.
-        _start_time (float): Time when the scene was created (seconds).
-        _screen (pygame.Surface): The surface representing the scene.
+        _start_time_ms (int): Tick count when the scene was created (milliseconds).
+        screen (pygame.Surface): The surface representing the scene.
         _objects (Objects): The collection of drawable/eventful/logical objects.
-        _object: The global object manager's objects.
+        object: The global object manager's registered classes (read-only view).
         _paused (bool): Whether the scene is currently paused.
         _background_color (tuple[int, int, int]): Background color for the scene.
         _event_queue (list[Event]): Scene-level event queue.
@@ -87,20 +96,45 @@ class BaseScene(ABC):
         """
         from xodex.scene.manager import SceneManager
 
-        self._size = settings.WINDOW_SIZE or (560, 480)
-        self._debug = settings.DEBUG or True
-        self._start_time = pygame.time.get_ticks() / 1000
-        self._screen = pygame.Surface(self._size)
-        self._object = ObjectsManager().get_objects()
+        self.size = settings.WINDOW_SIZE or (560, 480)
+        self._debug = getattr(settings, "DEBUG", False)
+        self._start_time_ms = _get_ticks()
+        self._frame_ticks = self._start_time_ms
+        # Plain attributes, not properties: these never change outside
+        # __init__/_on_resize, and frame loops read them constantly — a
+        # direct read skips the descriptor __get__ per access.
+        # The screen is a view into a max-size backing buffer so resize
+        # events never reallocate pixels (see _on_resize).
+        max_size = getattr(settings, "MAX_WINDOW_SIZE", (1920, 1080))
+        max_size = (max(max_size[0], self.size[0]), max(max_size[1], self.size[1]))
+        self._backing = pygame.Surface(max_size)
+        self.screen = self._backing.subsurface((0, 0, *self.size))
+        self.object = _objects_manager.get_objects()
         self._manager = SceneManager()
         self._objects = Objects()
         self._paused = False
         self._background_color = (255, 255, 255)
         self._first_entered = False
-        self._height = self._size[1]
-        self._width = self._size[0]
+        self._height = self.size[1]
+        self._width = self.size[0]
         self._event_queue: list[Event] = []
         self._debug_overlay = False
+        # Tuples, not lists: registration is rare, iteration is per-frame,
+        # and FOR_ITER over a tuple skips the list size re-checks.
+        self._on_draw_callbacks: tuple[Callable, ...] = ()
+        self._on_update_callbacks: tuple[Callable, ...] = ()
+        self._dirty_rects: list = []
+        self._dirty_only = False
+        if not self._debug:
+            # The default on_pause/on_resume bodies only emit debug logs,
+            # so with debug off they can be skipped outright — but only
+            # when a subclass hasn't overridden them, else the instance
+            # binding would shadow real hook logic.
+            cls = type(self)
+            if cls.on_pause is BaseScene.on_pause:
+                self.on_pause = _noop_hook
+            if cls.on_resume is BaseScene.on_resume:
+                self.on_resume = _noop_hook
 
     def __str__(self):
         """Return a string representation of the Scene."""
@@ -120,6 +154,10 @@ class BaseScene(ABC):
         """
         raise NotImplementedError
 
+    def _tick(self) -> None:
+        """Refresh the frame tick cache; the manager calls this once per frame."""
+        self._frame_ticks = _get_ticks()
+
     def _on_resize(self, size):
         """
         Handle window resize event.
@@ -127,12 +165,17 @@ class BaseScene(ABC):
         Args:
             size (tuple[int, int]): New window size.
         """
-        self._size = size
-        self._screen = pygame.Surface(self._size)
-        self._height = self._size[1]
-        self._width = self._size[0]
+        self.size = size
+        backing_w, backing_h = self._backing.get_size()
+        if size[0] > backing_w or size[1] > backing_h:
+            # Only grow the backing buffer when the window exceeds it;
+            # a resize drag then allocates at most once.
+            self._backing = pygame.Surface((max(size[0], backing_w), max(size[1], backing_h)))
+        self.screen = self._backing.subsurface((0, 0, *size))
+        self._height = size[1]
+        self._width = size[0]
         if self._debug:
-            logger.info(f"SceneWindow resized to: {self._size}")
+            logger.info(f"SceneWindow resized to: {size}")
 
     # endregion
 
@@ -146,7 +189,10 @@ class BaseScene(ABC):
         Returns:
             float: Seconds since scene was created.
         """
-        return pygame.time.get_ticks() / 1000 - self._start_time
+        # Reads the per-frame tick cache instead of hitting SDL: many
+        # objects poll elapsed within one frame, and they should all see
+        # the same timestamp anyway.
+        return (self._frame_ticks - self._start_time_ms) * 0.001
 
     @property
     def height(self) -> int:
@@ -158,16 +204,6 @@ class BaseScene(ABC):
         """Return the Scene Surface Width."""
         return self._width
 
-    @property
-    def screen(self) -> pygame.Surface:
-        """Return the Scene Surface."""
-        return self._screen
-
-    @property
-    def object(self) -> ObjectsManager:
-        """Return Object Manager's objects."""
-        return self._object
-
     @property
     def objects(self) -> Objects:
         """Return all Scene's objects."""
@@ -188,12 +224,7 @@ class BaseScene(ABC):
         Returns:
             DrawableObject | EventfulObject | LogicalObject | None: The requested object, or None if not found.
         """
-        return ObjectsManager().get_object(object_name=object_name)
-
-    @property
-    def size(self) -> tuple[int, int]:
-        """Return the Scene Screen Size (width, height)."""
-        return self._size
+        return _objects_manager.get_object(object_name=object_name)
 
     def draw_scene(self, *args, **kwargs) -> pygame.Surface:
         """
@@ -202,21 +233,88 @@ class BaseScene(ABC):
         Returns:
             pygame.Surface: The updated scene surface.
         """
-        self._screen.fill(self._background_color)
-        self._objects.draw_object(self._screen, *args, **kwargs)
+        screen = self.screen
+        if self._dirty_only:
+            # Redraw only the regions reported dirty since the last frame;
+            # clipping bounds the pixel writes, so a quiet frame costs
+            # almost nothing instead of a full-screen fill and redraw.
+            if self._dirty_rects:
+                set_clip = screen.set_clip
+                for rect in self._dirty_rects:
+                    set_clip(rect)
+                    screen.fill(self._background_color)
+                    self._objects.draw_object(screen, *args, **kwargs)
+                set_clip(None)
+            return screen
+        screen.fill(self._background_color)
+        self._objects.draw_object(screen, *args, **kwargs)
+        for callback in self._on_draw_callbacks:
+            callback(screen)
         if self._debug_overlay:
             self.draw_debug_overlay()
-        return self._screen
+        return screen
 
     def update_scene(self, deltatime: float, *args, **kwargs) -> None:
         """
-        Update all objects in the scene, unless paused.
+        Update all objects in the scene.
+
+        While paused, pause() rebinds this name to a no-op on the
+        instance, so the method body carries no paused check.
 
         Args:
             deltatime (float): Time since last update (ms).
         """
-        if not self._paused:
-            self._objects.update_object(deltatime, *args, **kwargs)
+        self._objects.update_object(deltatime, *args, **kwargs)
+        for callback in self._on_update_callbacks:
+            callback(deltatime)
+
+    def add_dirty_rect(self, rect) -> None:
+        """
+        Report a region that needs redrawing this frame.
+
+        Only consulted when dirty-rect drawing is enabled; objects (or
+        scene code) call this as they move or change.
+        """
+        self._dirty_rects.append(rect)
+
+    def consume_dirty_rects(self) -> list:
+        """Return this frame's dirty rects and reset the list (for pygame.display.update)."""
+        rects = self._dirty_rects
+        self._dirty_rects = []
+        return rects
+
+    def enable_dirty_rects(self) -> None:
+        """
+        Redraw and present only reported dirty regions.
+
+        Scenes that opt in must report every changed region through
+        add_dirty_rect; unreported changes will not reach the screen.
+        Draw callbacks and the debug overlay are skipped in this mode.
+        """
+        self._dirty_only = True
+
+    def disable_dirty_rects(self) -> None:
+        """Return to full-surface drawing each frame."""
+        self._dirty_only = False
+        self._dirty_rects.clear()
+
+    def add_on_draw(self, callback: Callable) -> None:
+        """
+        Register a callback run after the scene's objects are drawn.
+
+        Args:
+            callback: Called with the scene surface each frame.
+        """
+        self._on_draw_callbacks = (*self._on_draw_callbacks, callback)
+
+    def add_on_update(self, callback: Callable) -> None:
+        """
+        Register a callback run after the scene's objects are updated.
+
+        Args:
+            callback: Called with the frame's deltatime.
+        """
+        self._on_update_callbacks = (*self._on_update_callbacks, callback)
 
     async def async_update_scene(self, deltatime: float, *args, **kwargs) -> None:
         """
@@ -230,13 +328,15 @@ class BaseScene(ABC):
         """
         Handle an event for all objects in the scene.
 
+        While paused, pause() rebinds this name to _handle_paused on the
+        instance, so the method body carries no paused check. Resize
+        events are applied upstream by the game loop's VIDEORESIZE
+        prefilter, so there is no per-event type check here either.
+
         Args:
             event (pygame.event.Event): The event to handle.
         """
-        if event.type == pygame.VIDEORESIZE:
-            self._on_resize(event.size)
-        if not self._paused:
-            self._objects.handle_object(event, *args, **kwargs)
+        self._objects.handle_object(event, *args, **kwargs)
 
     def add_event(self, event: Event) -> None:
         """
@@ -284,7 +384,7 @@ class BaseScene(ABC):
         Returns:
             pygame.Surface: A copy of the scene's surface.
         """
-        return self._screen.copy()
+        return self.screen.copy()
 
     def export_image(self, filename: str) -> None:
         """
@@ -293,7 +393,7 @@ class BaseScene(ABC):
         Args:
             filename (str): Path to save the image.
         """
-        pygame.image.save(self._screen, filename)
+        pygame.image.save(self.screen, filename)
         if self._debug:
             logger.info(f"[{self.__class__.__name__}] Scene exported to {filename}")
 
@@ -317,7 +417,10 @@ class BaseScene(ABC):
         Args:
             state (dict): State to load.
         """
-        self._paused = state.get("paused", self._paused)
+        if state.get("paused", self._paused):
+            self.pause()
+        else:
+            self.resume()
         self._background_color = state.get("background_color", self._background_color)
 
     def toggle_debug_overlay(self) -> None:
@@ -336,11 +439,11 @@ class BaseScene(ABC):
             f"Elapsed: {self.elapsed:.2f}s",
             f"Paused: {self._paused}",
             f"Objects: {len(self._objects)}",
-            f"Size: {self._size}",
+            f"Size: {self.size}",
         ]
         for i, line in enumerate(info):
             surf = font.render(line, True, (0, 0, 0))
-            self._screen.blit(surf, (8, 8 + i * 18))
+            self.screen.blit(surf, (8, 8 + i * 18))
 
     def setup(self):
         """
@@ -348,7 +451,7 @@ class BaseScene(ABC):
         """
         self._objects.clear()
         if objects := self._generate_objects_():
-            self._objects.extend(list(objects))
+            self._objects.extend(objects)
         if self._debug:
             logger.info(f"[{self.__class__.__name__}] Objects after setup: {len(self._objects)}")
 
@@ -361,14 +464,27 @@ class BaseScene(ABC):
         if asyncio.iscoroutine(objects):
             objects = await objects
         if objects:
-            self._objects.extend(list(objects))
+            self._objects.extend(objects)
         if self._debug:
             logger.info(f"[{self.__class__.__name__}] Objects after setup: {len(self._objects)}")
 
+    # B027 suppressed below: these are deliberate no-ops swapped over the
+    # scene's update/handle methods while paused, not overridable hooks.
+    def _update_paused(self, deltatime: float, *args, **kwargs) -> None:  # noqa: B027
+        """No-op bound over update_scene while the scene is paused."""
+
+    def _handle_paused(self, event: Event, *args, **kwargs) -> None:  # noqa: B027
+        """Paused event handler: object dispatch is dropped (resizes arrive via the loop prefilter)."""
+
     def pause(self):
         """Pause the scene (updates and event handling will be skipped)."""
         if not self._paused:
             self._paused = True
+            # Instance bindings shadow the class (and subclass) methods for
+            # the duration of the pause; resume() deletes them, restoring
+            # normal dispatch without a per-call branch.
+            self.update_scene = self._update_paused
+            self.handle_scene = self._handle_paused
             self.on_pause()
             if self._debug:
                 logger.info(f"[{self.__class__.__name__}] Scene paused.")
@@ -377,6 +493,8 @@ class BaseScene(ABC):
         """Resume the scene (updates and event handling will continue)."""
         if self._paused:
             self._paused = False
+            del self.update_scene
+            del self.handle_scene
             self.on_resume()
             if self._debug:
                 logger.info(f"[{self.__class__.__name__}] Scene resumed.")
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from collections.abc import Callable
 from typing import Any
 
+import pygame
 from pygame import Surface
 
 from xodex.core.exceptions import AlreadyRegistered
@@ -19,6 +21,67 @@ __all__ = ("SceneManager", "register")
 logger = get_xodex_logger(__name__)
 
 
+class _UpdatePipeline:
+    """
+    One-frame update/draw overlap for the scene manager.
+
+    Draw stays on the main thread (SDL requirement); the current scene's
+    update runs on a worker thread while the caller flushes the drawn
+    frame to the display. The trade-off is one frame of input latency:
+    the frame on screen was computed before the update now in flight.
+    """
+
+    def __init__(self, manager: BaseManager) -> None:
+        self._manager = manager
+        self._kick = threading.Event()
+        self._done = threading.Event()
+        self._done.set()
+        self._stopped = False
+        self._deltatime = 0.0
+        self._last_ticks = pygame.time.get_ticks()
+        self._thread = threading.Thread(target=self._run, name="xodex-update", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._kick.wait()
+            self._kick.clear()
+            if self._stopped:
+                return
+            scene = self._manager.current
+            try:
+                if scene:
+                    scene._tick()
+                    scene.update_scene(self._deltatime)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Error in pipelined update")
+            finally:
+                self._done.set()
+
+    def wait(self) -> None:
+        """Block until the in-flight update (if any) has finished."""
+        self._done.wait()
+
+    def kick(self) -> None:
+        """Start the next update; the caller may overlap it with display work."""
+        self._done.wait()
+        # Measure deltatime here, on the main thread, so the worker sees the
+        # elapsed milliseconds between kicks — the pipelined equivalent of
+        # the clock delta the serial loop passes to update_scene.
+        now = pygame.time.get_ticks()
+        self._deltatime = now - self._last_ticks
+        self._last_ticks = now
+        self._done.clear()
+        self._kick.set()
+
+    def stop(self) -> None:
+        """Finish the in-flight update and shut the worker down."""
+        self._done.wait()
+        self._stopped = True
+        self._kick.set()
+        self._thread.join()
+
+
 class BaseManager(Singleton):
     """
     Scene Manager with stack navigation, transitions, scene lookup, and hooks.
@@ -39,10 +102,26 @@ class BaseManager(Singleton):
         manager.reset("AnotherScene")
     """
 
+    __slots__ = (
+        "__scene_classes",
+        "__scenes",
+        "_user_hooks",
+        "_pipeline",
+        "_current",
+        "__values_cache",
+        "__names_cache",
+        "__scene_lookup",
+    )
+
     def __init__(self):
         self.__scene_classes: dict[str, type[BaseScene]] = {}
         self.__scenes: list[BaseScene] = []
         self._user_hooks: dict[str, list[Callable]] = {}
+        self._pipeline: _UpdatePipeline | None = None
+        self._current: BaseScene | None = None
+        self.__values_cache: Values | None = None
+        self.__names_cache: tuple[str, ...] | None = None
+        self.__scene_lookup: dict[str, BaseScene] = {}
 
     # region Properties
 
@@ -54,11 +133,9 @@ class BaseManager(Singleton):
     @property
     def current(self) -> BaseScene | None:
         """Return the current (top) scene, or None if stack is empty."""
-        try:
-            return self.__scenes[-1]
-        except IndexError:
-            logger.warning("Scene stack is empty.")
-            return None
+        # Maintained by append/pop/clear/reset; per-frame readers skip the
+        # list indexing and exception-handler setup.
+        return self._current
 
     @property
     def previous(self) -> BaseScene | None:
@@ -91,9 +168,13 @@ class BaseManager(Singleton):
         """
         if not issubclass(scene_class, BaseScene):
             raise SceneError(f"{scene_class} is not a subclass of BaseScene.")
-        if self.is_registered(scene_name):
+        # setdefault makes the duplicate check and the insert one hash
+        # lookup; re-registering the same class under the same name is a
+        # no-op rather than an error.
+        if self.__scene_classes.setdefault(scene_name, scene_class) is not scene_class:
             raise AlreadyRegistered(f"The Scene '{scene_name}' is already registered.")
-        self.__scene_classes[scene_name] = scene_class
+        self.__values_cache = None
+        self.__names_cache = None
         logger.info(f"Registered scene '{scene_name}'.")
 
     def unregister(self, scene_name: str) -> None:
@@ -106,6 +187,8 @@ class BaseManager(Singleton):
         if not self.is_registered(scene_name):
             raise NotRegistered(f"The Scene '{scene_name}' is not registered.")
         del self.__scene_classes[scene_name]
+        self.__values_cache = None
+        self.__names_cache = None
         logger.info(f"Unregistered scene '{scene_name}'.")
 
     def is_registered(self, scene_name: str) -> bool:
@@ -129,12 +212,16 @@ class BaseManager(Singleton):
         raise KeyError(f"{scene_name} is not a valid Scene")
 
     def get_scenes(self) -> Values:
-        """Get all registered scene classes as a Values object."""
-        return Values(self.__scene_classes)
+        """Get all registered scene classes as a Values object (cached until the registry changes)."""
+        if self.__values_cache is None:
+            self.__values_cache = Values(self.__scene_classes)
+        return self.__values_cache
 
-    def list_registered_scene_classes(self) -> list[str]:
-        """List all registered scene class names."""
-        return list(self.__scene_classes.keys())
+    def list_registered_scene_classes(self) -> tuple[str, ...]:
+        """All registered scene class names (cached tuple, rebuilt when the registry changes)."""
+        if self.__names_cache is None:
+            self.__names_cache = tuple(self.__scene_classes)
+        return self.__names_cache
 
     # endregion
 
@@ -152,7 +239,11 @@ class BaseManager(Singleton):
             scene = self.get_scene_class(scene)(*args, **kwargs)
         elif not isinstance(scene, BaseScene):
             raise SceneError("Scene must be a subclass of BaseScene or a string name.")
+        if self._pipeline is not None:
+            self._pipeline.wait()
         self.__scenes.append(scene)
+        self._current = scene
+        self.__scene_lookup.clear()
         self._setup_scene_()
         self._run_hook("after_enter")
         logger.info(f"Appended scene: {scene}")
@@ -168,7 +259,11 @@ class BaseManager(Singleton):
             logger.warning("Cannot pop: scene stack is empty.")
             return None
         self._run_hook("before_exit")
+        if self._pipeline is not None:
+            self._pipeline.wait()
         pop_scene = self.__scenes.pop()
+        self._current = self.__scenes[-1] if self.__scenes else None
+        self.__scene_lookup.clear()
         self._run_hook("after_enter")
         logger.info(f"Popped scene: {pop_scene}")
         return pop_scene
@@ -179,6 +274,8 @@ class BaseManager(Singleton):
             if hasattr(s, "on_last_exit"):
                 s.on_last_exit()
         self.__scenes.clear()
+        self._current = None
+        self.__scene_lookup.clear()
         logger.info("Cleared all scenes from stack.")
 
     def reset(self, scene: str | BaseScene, *args, **kwargs) -> None:
@@ -195,8 +292,15 @@ class BaseManager(Singleton):
             scene = self.get_scene_class(scene)(*args, **kwargs)
         elif not isinstance(scene, BaseScene):
             raise SceneError("Scene must be a subclass of BaseScene or a string name.")
-        self.__scenes = [scene]
-        self._setup_scene_()
+        if self._pipeline is not None:
+            self._pipeline.wait()
+        # In-place clear + append keeps the existing list object (and any
+        # outstanding references to it) instead of allocating a new one.
+        self.__scenes.clear()
+        self.__scenes.append(scene)
+        self._current = scene
+        self.__scene_lookup.clear()
+        scene.setup()
         self._run_hook("after_enter")
         logger.info(f"Reset scene stack with: {scene}")
 
@@ -239,8 +343,12 @@ class BaseManager(Singleton):
         Returns:
             The scene instance, or None if not found.
         """
+        found = self.__scene_lookup.get(scene_name)
+        if found is not None:
+            return found
         for scene in self.__scenes:
             if getattr(scene, "name", None) == scene_name or scene.__class__.__name__ == scene_name:
+                self.__scene_lookup[scene_name] = scene
                 return scene
         logger.warning(f"Scene '{scene_name}' not found in stack.")
         return None
@@ -269,20 +377,52 @@ class BaseManager(Singleton):
     # region Scene Processing
 
     def process_update(self) -> None:
-        """Update the current scene."""
-        if self.current:
-            self.current.update()
+        """Update the current scene (or sync with the pipelined update)."""
+        if self._pipeline is not None:
+            self._pipeline.wait()
+            return
+        current = self._current
+        if current:
+            current._tick()
+            current.update()
 
     def process_event(self, event: Any) -> None:
         """Send an event to the current scene."""
-        if self.current:
-            self.current.handle(event)
+        if self._pipeline is not None:
+            self._pipeline.wait()
+        if self._current:
+            self._current.handle(event)
 
     def process_draw(self) -> Surface | None:
         """Draw the current scene and return the surface."""
-        if self.current:
-            return self.current.draw()
-        return None
+        current = self._current
+        surface = current.draw() if current else None
+        if self._pipeline is not None:
+            # Kick the next update now so it overlaps the caller's
+            # display flip/vsync wait.
+            self._pipeline.kick()
+        return surface
+
+    def enable_pipelining(self) -> None:
+        """
+        Overlap scene updates with display presentation.
+
+        After this call, ``process_draw`` starts the next frame's update
+        on a worker thread and ``process_update`` merely waits for it, so
+        game logic runs while the previous frame is flushed to screen.
+        Costs one frame of input latency; scenes whose update touches the
+        display must not enable this.
+        """
+        if self._pipeline is None:
+            self._pipeline = _UpdatePipeline(self)
+            logger.info("Scene update pipelining enabled.")
+
+    def disable_pipelining(self) -> None:
+        """Return to strictly serial update/draw processing."""
+        if self._pipeline is not None:
+            self._pipeline.stop()
+            self._pipeline = None
+            logger.info("Scene update pipelining disabled.")
 
     # endregion
 
@@ -317,26 +457,61 @@ class BaseManager(Singleton):
 
     def _fade_transition(self, new_scene: BaseScene, duration: float, on_complete: Callable | None = None):
         """Fade out, switch scene, fade in."""
-        import pygame
-
         screen = pygame.display.get_surface()
         clock = pygame.time.Clock()
-        alpha_surface = pygame.Surface(screen.get_size())
-        alpha_surface.fill((0, 0, 0))
-        for alpha in range(0, 255, max(1, int(255 / (duration * 60)))):
-            self.process_draw()
-            alpha_surface.set_alpha(alpha)
-            screen.blit(alpha_surface, (0, 0))
-            pygame.display.flip()
-            clock.tick(60)
+        # The outgoing scene is static during the fade, so draw it once and
+        # replay the snapshot; each step is then two blits instead of a full
+        # scene render.
+        snapshot = self.process_draw()
+        snapshot = snapshot.copy() if snapshot is not None else screen.copy()
+        # The frame covers the whole screen, so display.update(rect)
+        # would push exactly the same pixels as flip(); keep the simpler
+        # full flip. A partial overlay would present only its rect.
+        flip = pygame.display.flip
+        tick = clock.tick
+        get_ticks = pygame.time.get_ticks
+        # Alpha follows wall-clock time, not a fixed 60-step ramp: the
+        # fade lasts `duration` seconds whatever frame rate the machine
+        # sustains, and slow hardware renders fewer, larger steps.
+        duration_ms = duration * 1000
+        start = get_ticks()
+        try:
+            import numpy as np
+            from pygame import surfarray
+        except ImportError:
+            # Blit path: replay the snapshot under a ramping black overlay.
+            alpha_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+            blit = screen.blit
+            fill = alpha_surface.fill
+            while (t := get_ticks() - start) < duration_ms:
+                alpha = int(255 * t / duration_ms)
+                blit(snapshot, (0, 0))
+                fill((0, 0, 0, alpha))
+                blit(alpha_surface, (0, 0))
+                flip()
+                tick(60)
+        else:
+            # Vectorized path: darken the snapshot's pixel array straight
+            # into the display surface — one C-level multiply/shift per
+            # frame instead of two blended blits, with both buffers reused.
+            src = surfarray.array3d(snapshot).astype(np.uint16)
+            scaled = np.empty_like(src)
+            frame = np.empty(src.shape, dtype=np.uint8)
+            blit_array = surfarray.blit_array
+            while (t := get_ticks() - start) < duration_ms:
+                alpha = int(255 * t / duration_ms)
+                np.multiply(src, 255 - alpha, out=scaled)
+                np.right_shift(scaled, 8, out=scaled)
+                frame[:] = scaled
+                blit_array(screen, frame)
+                flip()
+                tick(60)
         self.append(new_scene)
         if on_complete:
             on_complete()
 
     def _slide_transition(self, new_scene: BaseScene, duration: float, on_complete: Callable | None = None):
         """Slide transition (left to right)."""
-        import pygame
-
         screen = pygame.display.get_surface()
         clock = pygame.time.Clock()
         width, height = screen.get_size()
@@ -424,7 +599,13 @@ class BaseManager(Singleton):
         return len(self.__scenes)
 
 
-class SceneManager(BaseManager): ...
+class SceneManager(BaseManager):
+    __slots__ = ()
+
+
+# Resolved once at import; each @register decoration then skips the
+# singleton metaclass dispatch.
+_scene_manager = SceneManager()
 
 
 def register(cls=None, *, name: str = None):
@@ -443,7 +624,7 @@ def register(cls=None, *, name: str = None):
 
     def decorator(scene_cls):
         scene_name = name or scene_cls.__name__
-        SceneManager().register(scene_cls, scene_name)
+        _scene_manager.register(scene_cls, scene_name)
         return scene_cls
 
     if cls is None:
@@ -0,0 +1,66 @@
+"""Fast Pixel Operations
+
+Optional numba-compiled kernels for per-pixel work on surfarray buffers.
+Import `swap_rgb` and check `HAS_NUMBA` before using it on hot paths;
+when numba is missing the callers fall back to their NumPy code.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+try:
+    from numba import njit
+    from numba import prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+__all__ = ("HAS_NUMBA", "make_swap_kernel", "swap_rgb")
+
+
+def swap_rgb(arr, fr, fg, fb, tr, tg, tb):  # pragma: no cover - compiled
+    """Replace every (fr, fg, fb) pixel in a (w, h, 3) buffer with (tr, tg, tb), in place."""
+    for x in prange(arr.shape[0]):  # pylint: disable=not-an-iterable
+        for y in range(arr.shape[1]):
+            if arr[x, y, 0] == fr and arr[x, y, 1] == fg and arr[x, y, 2] == fb:
+                arr[x, y, 0] = tr
+                arr[x, y, 1] = tg
+                arr[x, y, 2] = tb
+
+
+if HAS_NUMBA:
+    swap_rgb = njit(parallel=True, cache=True)(swap_rgb)
+
+
+@lru_cache(maxsize=32)
+def make_swap_kernel(fr, fg, fb, tr, tg, tb):
+    """
+    Build a swap kernel specialized for one (from, to) RGB pair.
+
+    The channel values are baked into the generated source as integer
+    literals, so the compiled comparisons constant-fold to immediate
+    compares instead of loading six arguments per pixel. The factory is
+    memoized per color pair; reusing a pair (team-colour tints across a
+    sprite sheet) costs one dict hit. cache=True is omitted for the
+    njit wrap because numba cannot persist functions built from exec'd
+    source.
+    """
+    fr, fg, fb, tr, tg, tb = (int(v) & 0xFF for v in (fr, fg, fb, tr, tg, tb))
+    src = (
+        "def kernel(arr):\n"
+        "    for x in prange(arr.shape[0]):\n"
+        "        for y in range(arr.shape[1]):\n"
+        f"            if arr[x, y, 0] == {fr} and arr[x, y, 1] == {fg} and arr[x, y, 2] == {fb}:\n"
+        f"                arr[x, y, 0] = {tr}\n"
+        f"                arr[x, y, 1] = {tg}\n"
+        f"                arr[x, y, 2] = {tb}\n"
+    )
+    namespace = {"prange": prange}
+    exec(src, namespace)  # pylint: disable=exec-used
+    kernel = namespace["kernel"]
+    if HAS_NUMBA:
+        kernel = njit(parallel=True)(kernel)
+    return kernel
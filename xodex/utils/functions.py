@@ -209,28 +209,22 @@ def splitsheet(sheet: str | Surface, frame_size: tuple[int, int] = (64, 80), num
     elif isinstance(sheet, Surface):
         sheet = sheet
 
-    frames: list = []
     sheet_width, sheet_height = sheet.get_size()
+    frame_w, frame_h = frame_size
+
+    cols = sheet_width // frame_w
+    rows = sheet_height // frame_h
+    total = cols * rows if num_frames is None else min(num_frames, cols * rows)
 
-    cols = sheet_width // frame_size[0]
-    rows = sheet_height // frame_size[1]
-    count = 0
-
-    for y in range(rows):
-        for x in range(cols):
-            if num_frames is not None and count >= num_frames:
-                break
-            rect = pygame.Rect(
-                x * frame_size[0],
-                y * frame_size[1],
-                frame_size[0],
-                frame_size[1],
-            )
-            frame = sheet.subsurface(rect).copy()
-            frames.append(frame)
-            count += 1
-        if num_frames is not None and count >= num_frames:
-            break
+    # One flat loop with bound methods and tuple rects: the heavy lifting
+    # (subsurface + copy) is already C-level blitting, so the Python-side
+    # cost is just this bookkeeping.
+    frames: list = []
+    append = frames.append
+    subsurface = sheet.subsurface
+    for i in range(total):
+        y, x = divmod(i, cols)
+        append(subsurface((x * frame_w, y * frame_h, frame_w, frame_h)).copy())
     return frames
 
 
@@ -19,6 +19,10 @@ class SingletonMeta(type):
 class Singleton(metaclass=SingletonMeta):
     """Easy use of SingletonMeta"""
 
+    # Empty slots so slotted subclasses can actually drop their __dict__;
+    # subclasses that declare no __slots__ keep one as before.
+    __slots__ = ()
+
 
 def singleton(cls):
     """singleton"""
@@ -29,11 +29,12 @@ class Values:
             defaults (dict, optional): Initial attributes.
             **kwargs: Additional attributes.
         """
+        # One C-level dict merge per source instead of a setattr loop;
+        # Values has no descriptors or __setattr__ hook to bypass.
         if defaults:
-            for attr, val in defaults.items():
-                setattr(self, attr, val)
-        for attr, val in kwargs.items():
-            setattr(self, attr, val)
+            self.__dict__.update(defaults)
+        if kwargs:
+            self.__dict__.update(kwargs)
 
     def __getitem__(self, key: str) -> Any:
         """Get attribute by key (dict-style)."""